@@ -6,11 +6,37 @@ import requests
 import feedparser
 import time
 import re
+import math
+import html
+import string
 import traceback
+import hashlib
+import sqlite3
+import zlib
+import codecs
+import unicodedata
+from collections import Counter, deque
+import threading
+import queue
 import concurrent.futures
-from bs4 import BeautifulSoup
+from urllib.parse import urlparse
+from bs4 import BeautifulSoup, SoupStrainer
 import openai
 
+# HTML 파서 (lxml이 설치되어 있으면 더 빠른 lxml 사용)
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# 토큰 수 계산기 (tiktoken이 설치되어 있고 인코딩을 불러올 수 있을 때만 사용)
+try:
+    import tiktoken
+    TOKEN_ENCODING = tiktoken.encoding_for_model("gpt-4")
+except Exception:
+    TOKEN_ENCODING = None
+
 # 환경 변수에서 API 키 설정
 NAVER_CLIENT_ID = os.getenv("NAVER_CLIENT_ID")
 NAVER_CLIENT_SECRET = os.getenv("NAVER_CLIENT_SECRET")
@@ -19,12 +45,133 @@ FORCE_UPDATE = os.getenv("FORCE_UPDATE", "false").lower() == "true"  # 강제 
 
 # 임시 파일 경로
 TEMP_FILE = 'temp_results.json'
-SEARCH_CACHE_FILE = 'search_cache.json'
+RSS_STATE_FILE = 'rss_feed_state.json'  # 피드별 ETag/Last-Modified 저장
+CACHE_DB_FILE = 'factcheck_cache.db'  # LLM 응답 등 영구 캐시 (SQLite)
+
+# 게시된 팩트체크 카드 색인 (JSON Lines, 게시 순서대로 추가)
+FACTCHECK_INDEX_FILE = 'factchecks_index.jsonl'
+
+# 페이지 분할 설정 (index.html에는 첫 화면용 최신 카드만, 나머지는 월별 아카이브)
+INDEX_PAGE_CARDS = int(os.getenv("INDEX_PAGE_CARDS", "10"))
+ARCHIVE_DIR = 'archive'
+ARCHIVE_MANIFEST_FILE = os.path.join(ARCHIVE_DIR, 'manifest.json')
+CARDS_START_MARKER = "<!-- FACT_CHECK_CARDS -->"
+CARDS_END_MARKER = "<!-- /FACT_CHECK_CARDS -->"
+ARCHIVE_LINKS_START_MARKER = "<!-- ARCHIVE_LINKS -->"
+ARCHIVE_LINKS_END_MARKER = "<!-- /ARCHIVE_LINKS -->"
+
+# JSON 데이터 피드 설정 (게시 순서대로 고정 크기 청크로 분할)
+FEED_DIR = 'data'
+FEED_MANIFEST_FILE = f"{FEED_DIR}/factchecks.json"
+FEED_CHUNK_SIZE = 50
+
+# 스크리닝 결과 기록 (JSON Lines, 로컬 사전 스크리닝 분류기 학습용)
+SCREENING_HISTORY_FILE = 'screening_history.jsonl'
+SCREENING_HISTORY_MAX_RECORDS = 5000  # 기록 파일에 남기고 학습에 사용하는 최근 기록 수
+
+# 로컬 사전 스크리닝 분류기 설정 (통과 확률 기준 / 학습 최소 기록 수)
+SCREENING_CLASSIFIER_THRESHOLD = float(os.getenv("SCREENING_CLASSIFIER_THRESHOLD", "0.3"))
+SCREENING_CLASSIFIER_MIN_SAMPLES = 20  # 클래스별
+# 분류기가 너무 엄격해도 GPT 스크리닝으로 보내는 최소 기사 수 (탈락 기사 중 점수가 높은 순으로 보충)
+SCREENING_CLASSIFIER_MIN_CANDIDATES = int(os.getenv("SCREENING_CLASSIFIER_MIN_CANDIDATES", "5"))
+
+# LLM 응답 캐시 설정 (유효 기간 / 최대 항목 수)
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_DAYS", "7")) * 86400
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+
+# 기사 본문 일반 선택자 (사이트별 규칙이 없거나 맞지 않을 때 순서대로 시도)
+ARTICLE_SELECTORS = [
+    'article', '.article_body', '#articleBody', 
+    '.news_view', '.article-body', '.article-content',
+    '#article-view-content-div', '.article_cont', '.news_contents',
+    '.newsct_article', '#news_body_area', '.article_txt', '#article'
+]
+
+# 본문에서 제거할 요소
+ARTICLE_NOISE_SELECTOR = '.reporter_area, .byline, .share_area, .article_ad, script, style'
+
+# 사이트별 본문 추출 규칙 (도메인 → 본문 요소 (태그, 속성, 값) 후보)
+# 본문 요소만 파싱하고, 내려받을 때도 이 요소가 닫히면 읽기를 멈춤
+SITE_EXTRACTION_RULES = {
+    "news.naver.com": [("article", "id", "dic_area"), ("div", "id", "newsct_article"), ("div", "id", "articleBodyContents")],
+    "hani.co.kr": [("div", "class", "article-text"), ("div", "class", "text")],
+    "donga.com": [("section", "class", "news_view"), ("div", "class", "article_txt")],
+    "khan.co.kr": [("div", "id", "articleBody"), ("div", "class", "art_body")],
+    "joongang.co.kr": [("div", "id", "article_body")],
+    "joins.com": [("div", "id", "article_body")],
+    "ytn.co.kr": [("div", "id", "CmAdContent"), ("div", "class", "paragraph")]
+}
+
+# 페이지 다운로드 설정 (최대 바이트 수 / 읽기 단위)
+PAGE_MAX_BYTES = 1536 * 1024
+PAGE_CHUNK_BYTES = 16 * 1024
+
+# 한국 사이트에서 쓰이는 EUC-KR 계열 문자셋 이름 (확장 문자까지 디코딩하도록 cp949로 처리)
+CHARSET_ALIASES = {
+    "euc-kr": "cp949", "euc_kr": "cp949", "ks_c_5601-1987": "cp949",
+    "ksc5601": "cp949", "x-windows-949": "cp949", "windows-949": "cp949"
+}
+
+# 기사 페이지 캐시 설정 (유효 기간 / 최대 항목 수, HTML은 압축 저장)
+PAGE_CACHE_TTL_SECONDS = int(os.getenv("PAGE_CACHE_TTL_DAYS", "7")) * 86400
+PAGE_CACHE_MAX_ENTRIES = int(os.getenv("PAGE_CACHE_MAX_ENTRIES", "1000"))
+
+# 검색 결과 캐시 설정 (유효 기간 / 최대 항목 수)
+SEARCH_CACHE_TTL_SECONDS = int(os.getenv("SEARCH_CACHE_TTL_DAYS", "30")) * 86400
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "50000"))
+
+# 유사 발언 검색 캐시 재사용 설정 (사용 여부 / 최소 문자 n-gram 자카드 유사도)
+SEARCH_NEAR_DUPLICATE = os.getenv("SEARCH_NEAR_DUPLICATE", "true").lower() == "true"
+SEARCH_NEAR_DUPLICATE_MIN_SIMILARITY = float(os.getenv("SEARCH_NEAR_DUPLICATE_MIN_SIMILARITY", "0.8"))
 
 # 실행 시간 제한 설정 (18분)
 MAX_RUNTIME_SECONDS = 18 * 60
 start_time = time.time()
 
+# 네이버 API 동시 요청 설정 (동시 요청 수 / 초당 요청 수)
+NAVER_NEWS_API_URL = "https://openapi.naver.com/v1/search/news.json"
+NAVER_MAX_CONCURRENCY = int(os.getenv("NAVER_MAX_CONCURRENCY", "5"))
+NAVER_REQUESTS_PER_SECOND = float(os.getenv("NAVER_REQUESTS_PER_SECOND", "10"))
+
+# 근거 검색 설정 (네이버 검색 API 종류 / 요청당 결과 수, 인증 정보가 없거나 실패하면 검색 페이지 스크래핑)
+NAVER_SEARCH_API_URL = "https://openapi.naver.com/v1/search/{}.json"
+EVIDENCE_SEARCH_TYPES = ["news", "webkr", "blog"]
+EVIDENCE_SEARCH_DISPLAY = int(os.getenv("EVIDENCE_SEARCH_DISPLAY", "100"))
+
+# 프롬프트 토큰 예산 (팩트체크 예시 / 대체 검증의 기사 본문)
+FACTCHECK_EXAMPLE_TOKEN_BUDGET = int(os.getenv("FACTCHECK_EXAMPLE_TOKEN_BUDGET", "600"))
+FACTCHECK_EXAMPLE_COUNT = 3
+FALLBACK_ARTICLE_TOKEN_BUDGET = int(os.getenv("FALLBACK_ARTICLE_TOKEN_BUDGET", "1500"))
+
+# 근거 자료 선택 설정 (최대 개수 / 검증 프롬프트에 넣을 토큰 예산 / 최고 점수 대비 최소 BM25 점수 비율)
+EVIDENCE_TOP_K = 5
+EVIDENCE_TOKEN_BUDGET = int(os.getenv("EVIDENCE_TOKEN_BUDGET", "1500"))
+EVIDENCE_MIN_RELATIVE_SCORE = 0.5
+
+# RSS 피드 병렬 수집 설정 (피드 동시 요청 수 / 요약 추출 작업자 수)
+RSS_MAX_CONCURRENCY = int(os.getenv("RSS_MAX_CONCURRENCY", "5"))
+RSS_SUMMARY_WORKERS = int(os.getenv("RSS_SUMMARY_WORKERS", "5"))
+
+# 팩트체크 파이프라인 단계별 동시 실행 수
+PIPELINE_STAGE_WORKERS = {
+    "content": int(os.getenv("PIPELINE_CONTENT_WORKERS", "6")),
+    "screening": int(os.getenv("PIPELINE_SCREENING_WORKERS", "2")),
+    "extraction": int(os.getenv("PIPELINE_EXTRACTION_WORKERS", "4")),
+    "evidence": int(os.getenv("PIPELINE_EVIDENCE_WORKERS", "4")),
+    "verification": int(os.getenv("PIPELINE_VERIFICATION_WORKERS", "2"))
+}
+
+# 한 번의 실행에서 팩트체크할 최대 기사 수
+MAX_ARTICLES_TO_PROCESS = 30
+
+# 일괄 스크리닝 설정 (요청당 기사 수 / 기사당 내용 길이)
+SCREENING_BATCH_SIZE = int(os.getenv("SCREENING_BATCH_SIZE", "10"))
+SCREENING_BATCH_CONTENT_CHARS = 500
+
+# HTTP 연결 풀 크기
+HTTP_POOL_SIZE = 20
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
 # OpenAI 클라이언트 설정
 openai.api_key = OPENAI_API_KEY
 client = openai.OpenAI(api_key=OPENAI_API_KEY)
@@ -115,14 +262,179 @@ FACTCHECK_EXAMPLES = """
 출처: 산업통상자원부 수출입 동향(2023), 한국무역협회 무역통계
 """
 
+# 텍스트 토큰 수 추정
+def estimate_tokens(text):
+    """한글 등 비ASCII 문자는 글자당 1토큰, ASCII는 4글자당 1토큰으로 어림잡은 토큰 수"""
+    non_ascii = sum(1 for char in text if ord(char) > 127)
+    return non_ascii + (len(text) - non_ascii + 3) // 4
+
+# 텍스트 토큰 수 계산
+def count_tokens(text):
+    """tiktoken을 쓸 수 있으면 GPT-4 토크나이저로, 없으면 추정치로 계산"""
+    if TOKEN_ENCODING is not None:
+        return len(TOKEN_ENCODING.encode(text))
+    return estimate_tokens(text)
+
+# 토큰 예산에 맞게 텍스트 자르기
+def truncate_to_tokens(text, token_budget):
+    """token_budget을 넘으면 예산 안에 들어가는 앞부분만 남기고 "..." 추가"""
+    if count_tokens(text) <= token_budget:
+        return text
+    if TOKEN_ENCODING is not None:
+        return TOKEN_ENCODING.decode(TOKEN_ENCODING.encode(text)[:token_budget]) + "..."
+    
+    # 추정치 기준: 예산을 넘지 않는 가장 긴 앞부분을 이분 탐색
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if estimate_tokens(text[:middle]) <= token_budget:
+            low = middle
+        else:
+            high = middle - 1
+    return text[:low] + "..."
+
+# 팩트체크 예시 문자열을 사례별 레코드로 분리
+def parse_factcheck_examples(examples_text):
+    """분야 제목(## ...)과 번호 매긴 사례를 분야, 기관, 주장, 판정, 근거, 출처 레코드로 변환"""
+    records = []
+    category = ""
+    field_names = {"주장": "claim", "판정": "verdict", "근거": "explanation", "출처": "sources"}
+    
+    for line in examples_text.strip().splitlines():
+        line = line.strip()
+        heading = re.match(r'^##\s*(.+?)\s*분야', line)
+        example_start = re.match(r'^\d+\.\s*(.+)$', line)
+        field = re.match(r'^(주장|판정|근거|출처):\s*(.*)$', line)
+        
+        if heading:
+            category = heading.group(1)
+        elif example_start:
+            records.append({"category": category, "organization": example_start.group(1)})
+        elif field and records:
+            records[-1][field_names[field.group(1)]] = field.group(2)
+    
+    for record in records:
+        record["text"] = format_factcheck_example(record)
+        record["tokens"] = count_tokens(record["text"])
+    return records
+
+# 팩트체크 예시 레코드를 프롬프트용 텍스트로 변환
+def format_factcheck_example(record):
+    """예시 하나를 원래 예시 모음과 같은 형식으로 표시"""
+    return (
+        f"[{record['category']}] {record['organization']}\n"
+        f"주장: {record.get('claim', '')}\n"
+        f"판정: {record.get('verdict', '')}\n"
+        f"근거: {record.get('explanation', '')}\n"
+        f"출처: {record.get('sources', '')}"
+    )
+
+# 사례별 팩트체크 예시 (임포트 시 한 번만 분리)
+FACTCHECK_EXAMPLE_RECORDS = parse_factcheck_examples(FACTCHECK_EXAMPLES)
+
+# 고정 팩트체크 예시 선택 (분야별 하나씩, 판정이 겹치지 않도록)
+def static_factcheck_examples(records):
+    """분야마다 아직 쓰이지 않은 판정의 첫 예시를 골라 분야와 판정이 고루 섞인 고정 예시 목록 반환"""
+    selected = []
+    used_verdicts = set()
+    for category in dict.fromkeys(record["category"] for record in records):
+        candidates = [record for record in records if record["category"] == category]
+        record = next((record for record in candidates if record.get("verdict") not in used_verdicts), candidates[0])
+        used_verdicts.add(record.get("verdict"))
+        selected.append(record)
+    return selected
+
+# 검증 프롬프트 고정 부분에 들어가는 예시 (모든 검증 요청에서 같은 접두사가 되도록 고정)
+STATIC_FACTCHECK_EXAMPLES = static_factcheck_examples(FACTCHECK_EXAMPLE_RECORDS)
+
 # 블랙리스트 키워드 - 정치 관련 뉴스가 아닌 내용 필터링
 BLACKLIST_KEYWORDS = [
     "날씨", "코로나", "스포츠", "연예", "드라마", "영화", "공연", 
     "예능", "신곡", "음원", "임신", "결혼", "이혼", "사고", "사망"
 ]
 
-# 검색 결과 캐시
-search_cache = {}
+# 정치 관련 기사 판별 키워드
+POLITICAL_KEYWORDS = [
+    "대통령", "국회", "의원", "정부", "청와대", "여당", "야당", "정책", "장관",
+    "민주당", "국민의힘", "위원장", "대표", "대선", "총선", "선거",
+    "윤석열", "이재명", "홍준표", "한동훈", "조국"
+]
+
+# 정치인 이름 목록 (빠른 필터링용)
+POLITICIAN_NAMES = [
+    "윤석열", "이재명", "홍준표", "한동훈", "조국",
+    "이낙연", "우상호", "이준석", "나경원", "김경수"
+]
+
+# 발언/팩트체크 관련 키워드
+CLAIM_KEYWORDS = [
+    "발언", "주장", "말했", "밝혔", "반박", "비판", "지적",
+    "퍼센트", "증가", "감소", "통계", "수치", "사실", "팩트"
+]
+
+# 팩트체크에 부적합한 미래형 표현 (계획, 공약 등)
+FUTURE_TENSE_PATTERNS = ["하겠다", "계획", "예정", "공약", "제안"]
+
+# 다중 키워드 매처 - 아호-코라식 오토마타로 모든 키워드 목록을 한 번에 검사
+class KeywordMatcher:
+    """분류별 키워드 목록을 하나의 오토마타로 컴파일하여 텍스트 한 번 순회로 걸린 분류를 모두 찾음"""
+
+    def __init__(self, keyword_lists):
+        self.transitions = [{}]
+        self.outputs = [set()]
+        
+        # 키워드 트라이 구성 (대소문자 구분 없이 소문자로 저장)
+        for category, keywords in keyword_lists.items():
+            for keyword in keywords:
+                node = 0
+                for char in keyword.lower():
+                    if char not in self.transitions[node]:
+                        self.transitions.append({})
+                        self.outputs.append(set())
+                        self.transitions[node][char] = len(self.transitions) - 1
+                    node = self.transitions[node][char]
+                self.outputs[node].add(category)
+        
+        # 실패 링크 계산 (너비 우선), 실패 노드의 출력은 미리 합쳐 둠
+        self.failures = [0] * len(self.transitions)
+        pending = deque(self.transitions[0].values())
+        while pending:
+            node = pending.popleft()
+            for char, child in self.transitions[node].items():
+                fallback = self.failures[node]
+                while fallback and char not in self.transitions[fallback]:
+                    fallback = self.failures[fallback]
+                target = self.transitions[fallback].get(char, 0)
+                self.failures[child] = target if target != child else 0
+                self.outputs[child] |= self.outputs[self.failures[child]]
+                pending.append(child)
+
+    def categories(self, text):
+        """텍스트에 포함된 키워드의 분류 집합"""
+        found = set()
+        node = 0
+        for char in text.lower():
+            while node and char not in self.transitions[node]:
+                node = self.failures[node]
+            node = self.transitions[node].get(char, 0)
+            found |= self.outputs[node]
+        return found
+
+KEYWORD_MATCHER = KeywordMatcher({
+    "blacklist": BLACKLIST_KEYWORDS,
+    "political": POLITICAL_KEYWORDS,
+    "politician": POLITICIAN_NAMES,
+    "claim": CLAIM_KEYWORDS,
+    "future": FUTURE_TENSE_PATTERNS
+})
+
+# 검색 결과 캐시와 유사 발언 색인 (initialize()에서 연결)
+search_cache = None
+search_fingerprints = None
+
+# LLM 응답 캐시와 기사 페이지 캐시 (initialize()에서 연결)
+llm_cache = None
+page_cache = None
 
 # 중복 방지를 위한 세트
 processed_urls = set()
@@ -134,105 +446,616 @@ def print_progress(message):
     elapsed = time.time() - start_time
     print(f"[{elapsed:.1f}s] {message}")
 
-# GPT-4를 사용하여 JSON 응답 얻기 (유틸리티 함수)
-def gpt4_json_request(prompt, system_prompt=None):
-    """GPT-4에 요청하여 JSON 형태의 응답 반환"""
-    if not system_prompt:
-        system_prompt = "당신은 팩트체크 및 데이터 분석 전문가입니다. 주어진 질문에 대해 정확하고 객관적인 JSON 응답을 제공합니다."
+# 공유 HTTP 세션 생성 (keep-alive 연결 재사용)
+def create_http_session(pool_size):
+    """연결 풀을 공유하는 requests 세션 생성"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+# 토큰 버킷 속도 제한기
+class TokenBucket:
+    """초당 요청 수를 제한하는 토큰 버킷 (스레드 안전)"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 대기"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_seconds = (1 - self.tokens) / self.rate
+            time.sleep(wait_seconds)
+
+http_session = create_http_session(HTTP_POOL_SIZE)
+naver_rate_limiter = TokenBucket(NAVER_REQUESTS_PER_SECOND)
+
+# SQLite 기반 영구 캐시
+class PersistentCache:
+    """TTL 만료와 크기 제한 LRU 제거를 지원하는 SQLite 키-값 캐시 (스레드 안전, 선택적 zlib 압축)"""
+
+    def __init__(self, path, table, ttl_seconds, max_entries, compress=False):
+        self.table = table
+        self.compress = compress
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+            "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self.conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_accessed_at ON {table} (accessed_at)")
+        self.conn.commit()
+
+    def __len__(self):
+        with self.lock:
+            return self.conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def get(self, key):
+        """캐시 값 반환 (없거나 만료되면 None), 조회 시각 갱신"""
+        now = time.time()
+        with self.lock:
+            row = self.conn.execute(
+                f"SELECT value, created_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+            self.conn.execute(f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key))
+            self.conn.commit()
+            self.hits += 1
+        return json.loads(zlib.decompress(row[0]) if self.compress else row[0])
+
+    def set(self, key, value):
+        """캐시 값 저장 (즉시 커밋)"""
+        self.set_many({key: value})
+
+    def set_many(self, items):
+        """여러 값을 한 트랜잭션으로 저장"""
+        now = time.time()
+        rows = [(key, self.encode(value), now, now) for key, value in items.items()]
+        with self.lock:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            self.conn.commit()
+
+    def encode(self, value):
+        """저장 형식으로 변환 (압축 캐시는 JSON을 zlib으로 압축)"""
+        text = json.dumps(value, ensure_ascii=False)
+        return zlib.compress(text.encode('utf-8')) if self.compress else text
+
+    def evict(self):
+        """만료 항목을 지우고, 최대 개수를 넘으면 가장 오래 조회되지 않은 항목부터 삭제"""
+        with self.lock:
+            removed = self.conn.execute(
+                f"DELETE FROM {self.table} WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            ).rowcount
+            count = self.conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+            if count > self.max_entries:
+                removed += self.conn.execute(
+                    f"DELETE FROM {self.table} WHERE key IN "
+                    f"(SELECT key FROM {self.table} ORDER BY accessed_at LIMIT ?)",
+                    (count - self.max_entries,)
+                ).rowcount
+            self.conn.commit()
+        return removed
+
+    def stats_message(self, label):
+        """적중/미스 통계 문자열"""
+        return f"{label} 캐시 적중 {self.hits}회, 미스 {self.misses}회 ({len(self)}개 항목)"
+
+# ===== LLM 클라이언트: JSON 모드 요청, 단계별 응답 스키마 검증, 형식 복구 재시도 =====
+
+# response_format JSON 모드를 지원하는 모델 (초기 gpt-4는 지원하지 않아 스키마 검증과 복구만 적용)
+JSON_MODE_MODELS = {"gpt-3.5-turbo", "gpt-4-turbo", "gpt-4o", "gpt-4o-mini"}
+
+# 단계별 모델 승급 순서 (앞 모델의 응답이 검증을 통과하지 못하면 다음 모델로 재요청)
+# 환경 변수 <단계>_MODELS (예: VERIFICATION_MODELS=gpt-4o-mini,gpt-4)로 바꿀 수 있음
+DEFAULT_STAGE_MODELS = {
+    "screening": ["gpt-3.5-turbo"],
+    "extraction": ["gpt-3.5-turbo", "gpt-4o-mini"],
+    "verification": ["gpt-4o-mini", "gpt-4"],
+    "fallback": ["gpt-4o-mini", "gpt-4"],
+    "repair": ["gpt-3.5-turbo"]  # 형식이 맞지 않는 응답 복구
+}
+STAGE_MODELS = {
+    stage: [model.strip() for model in os.getenv(f"{stage.upper()}_MODELS", ",".join(models)).split(",") if model.strip()] or models
+    for stage, models in DEFAULT_STAGE_MODELS.items()
+}
+
+# 모델별 100만 토큰당 가격 (USD: 입력, 캐시 적중 입력, 출력)
+MODEL_PRICING = {
+    "gpt-3.5-turbo": (0.50, 0.50, 1.50),
+    "gpt-4": (30.00, 30.00, 60.00),
+    "gpt-4-turbo": (10.00, 10.00, 30.00),
+    "gpt-4o": (2.50, 1.25, 10.00),
+    "gpt-4o-mini": (0.15, 0.075, 0.60)
+}
+
+# 팩트체크 판정 값
+VERIFICATION_RESULTS = ["사실", "대체로 사실", "일부 사실", "사실 아님", "확인 불가"]
+
+# 단계별 응답 스키마 (필수 필드 → 타입, 선택 필드 → 타입, 필드별 허용 값)
+RESPONSE_SCHEMAS = {
+    "screening": {
+        "required": {"has_factcheckable_claim": bool},
+        "optional": {"reasons": list}
+    },
+    "batch_screening": {
+        "required": {"results": list}
+    },
+    "quotes": {
+        "required": {"quotes": list}
+    },
+    "verdict": {
+        "required": {"verification_result": str, "explanation": str},
+        "optional": {"speaker": str, "speaker_position": str, "party": str, "statement": str, "context": str, "sources": list},
+        "choices": {"verification_result": VERIFICATION_RESULTS}
+    }
+}
+
+JSON_DECODER = json.JSONDecoder()
+
+# 스키마 타입의 프롬프트용 이름
+JSON_TYPE_NAMES = {bool: "true/false", str: "문자열", list: "배열"}
+
+# 응답 텍스트에서 JSON 추출
+def parse_json_response(response_text):
+    """응답 전체를 JSON으로 읽고, 안 되면 첫 '{'부터 한 객체만 읽음 (실패 시 None)"""
+    response_text = response_text.strip()
+    try:
+        parsed = json.loads(response_text)
+    except ValueError:
+        start = response_text.find("{")
+        if start < 0:
+            print_progress(f"JSON 형식 응답 없음: {response_text[:100]}...")
+            return None
+        try:
+            parsed, _ = JSON_DECODER.raw_decode(response_text, start)
+        except ValueError:
+            print_progress(f"JSON 파싱 오류: {response_text[:100]}...")
+            return None
+    
+    return parsed if isinstance(parsed, dict) else None
+
+# 응답 스키마 검증
+def validate_response(parsed, schema_name=None):
+    """스키마에 맞지 않는 부분의 설명 목록 반환 (맞으면 빈 목록)"""
+    if not isinstance(parsed, dict):
+        return ["JSON 객체가 아님"]
+    if schema_name is None:
+        return []
+    
+    schema = RESPONSE_SCHEMAS[schema_name]
+    errors = []
+    for field, field_type in schema["required"].items():
+        if field not in parsed:
+            errors.append(f"필수 필드 '{field}' 누락")
+    for field, field_type in {**schema["required"], **schema.get("optional", {})}.items():
+        if field in parsed and not isinstance(parsed[field], field_type):
+            errors.append(f"'{field}' 필드는 {JSON_TYPE_NAMES[field_type]}이어야 함")
+    for field, choices in schema.get("choices", {}).items():
+        if isinstance(parsed.get(field), str) and parsed[field] not in choices:
+            errors.append(f"'{field}' 필드는 {', '.join(choices)} 중 하나여야 함")
+    return errors
+
+# 형식이 맞지 않는 응답 복구
+def repair_json_response(response_text, schema_name, errors):
+    """저렴한 모델에 원래 응답과 오류를 보내 스키마에 맞는 JSON으로 한 번만 고쳐 받음 (실패 시 None)"""
+    schema = RESPONSE_SCHEMAS.get(schema_name, {"required": {}})
+    field_lines = [
+        f'- "{field}" ({JSON_TYPE_NAMES[field_type]}, {"필수" if field in schema["required"] else "선택"})'
+        for field, field_type in {**schema["required"], **schema.get("optional", {})}.items()
+    ]
+    for field, choices in schema.get("choices", {}).items():
+        field_lines.append(f'- "{field}" 값은 {", ".join(choices)} 중 하나')
+    
+    prompt = f"""아래 응답을 내용은 바꾸지 말고 형식만 고쳐 JSON 객체 하나로 다시 작성해주세요.
+
+문제점: {"; ".join(errors)}
+필드:
+{chr(10).join(field_lines) or "- 원래 응답의 필드 그대로"}
+
+원래 응답:
+{response_text[:6000]}"""
     
     try:
+        print_progress(f"응답 형식 복구 요청 중 ({'; '.join(errors)})")
+        request_started = time.time()
+        repair_model = STAGE_MODELS["repair"][0]
         response = client.chat.completions.create(
-            model="gpt-4",
+            model=repair_model,
             messages=[
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": "당신은 깨진 JSON을 주어진 형식에 맞게 고치는 도우미입니다. JSON 객체만 출력합니다."},
                 {"role": "user", "content": prompt}
             ],
-            temperature=0.1
+            temperature=0,
+            response_format={"type": "json_object"}
         )
-        
-        response_text = response.choices[0].message.content.strip()
-        
-        # JSON 추출
-        json_match = re.search(r'(\{.*\})', response_text, re.DOTALL)
-        if json_match:
-            try:
-                return json.loads(json_match.group(1))
-            except json.JSONDecodeError:
-                print_progress(f"JSON 파싱 오류: {response_text[:100]}...")
-                return None
-        else:
-            print_progress(f"JSON 형식 응답 없음: {response_text[:100]}...")
-            return None
-            
+        record_llm_usage("repair", repair_model, response.usage, time.time() - request_started)
     except Exception as e:
-        print_progress(f"GPT-4 요청 오류: {e}")
+        print_progress(f"응답 형식 복구 오류: {e}")
+        return None
+    
+    repaired = parse_json_response(response.choices[0].message.content)
+    if validate_response(repaired, schema_name):
+        print_progress("응답 형식 복구 실패")
         return None
+    return repaired
 
-# GPT-3.5를 사용하여 JSON 응답 얻기 (경제적인 버전)
-def gpt35_json_request(prompt, system_prompt=None):
-    """GPT-3.5에 요청하여 JSON 형태의 응답 반환 (비용 절감)"""
-    if not system_prompt:
-        system_prompt = "당신은 팩트체크 및 데이터 분석 전문가입니다. 주어진 질문에 대해 정확하고 객관적인 JSON 응답을 제공합니다."
+# LLM 응답 캐시 키 생성
+def llm_cache_key(model, system_prompt, prompt, temperature, max_tokens):
+    """모델, 프롬프트, 샘플링 설정으로 만든 내용 기반 해시"""
+    payload = json.dumps([model, system_prompt, prompt, temperature, max_tokens], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+# 단계·모델별 API 사용량 (호출 수, LLM 캐시 적중 수, 요청 오류 수, 검증 불합격 수, 입력/캐시 적중/출력 토큰, 응답 시간)
+llm_usage = {}
+llm_usage_lock = threading.Lock()
+
+# API 응답의 사용량 기록
+def record_llm_usage(stage, model, usage, latency, estimated_tokens=None):
+    """응답의 usage 필드에서 입력 토큰 중 서버 측 프롬프트 접두사 캐시에 적중한 토큰 수까지 누적
+
+    중간에 끊은 스트리밍 응답처럼 usage가 없으면 estimated_tokens(입력, 출력)로 대신 누적한다.
+    """
+    details = getattr(usage, "prompt_tokens_details", None) if usage else None
+    with llm_usage_lock:
+        stats = llm_usage.setdefault((stage, model), Counter())
+        stats["calls"] += 1
+        stats["latency"] += latency
+        if usage:
+            stats["prompt_tokens"] += usage.prompt_tokens or 0
+            stats["completion_tokens"] += usage.completion_tokens or 0
+            stats["cached_tokens"] += (getattr(details, "cached_tokens", None) or 0) if details else 0
+        elif estimated_tokens:
+            stats["prompt_tokens"] += estimated_tokens[0]
+            stats["completion_tokens"] += estimated_tokens[1]
+
+# 사용량 외의 요청 결과 기록 (LLM 응답 캐시 적중, 요청 오류, 검증 불합격)
+def count_llm_event(stage, model, event):
+    """단계·모델별 사용량에 이벤트 횟수만 더함"""
+    with llm_usage_lock:
+        llm_usage.setdefault((stage, model), Counter())[event] += 1
+
+# 사용량 비용 계산
+def llm_usage_cost(model, stats):
+    """MODEL_PRICING으로 계산한 달러 비용 (가격을 모르는 모델은 None)"""
+    if model not in MODEL_PRICING:
+        return None
+    input_price, cached_price, output_price = MODEL_PRICING[model]
+    uncached_tokens = stats["prompt_tokens"] - stats["cached_tokens"]
+    return (uncached_tokens * input_price + stats["cached_tokens"] * cached_price + stats["completion_tokens"] * output_price) / 1_000_000
+
+# API 사용량 요약 출력
+def print_llm_usage():
+    """단계·모델별 호출 수, 토큰 수, 접두사 캐시 적중 비율, 비용, 평균 응답 시간과 실행 전체 비용 출력"""
+    total_cost = 0.0
+    for (stage, model), stats in sorted(llm_usage.items()):
+        cost = llm_usage_cost(model, stats)
+        total_cost += cost or 0
+        cached_ratio = stats["cached_tokens"] / stats["prompt_tokens"] * 100 if stats["prompt_tokens"] else 0
+        print_progress(
+            f"[{stage}] {model}: {stats['calls']}회 호출 (LLM 캐시 적중 {stats['cache_hits']}회, 오류 {stats['errors']}회, 불합격 {stats['rejected']}회), "
+            f"입력 {stats['prompt_tokens']}토큰 (캐시 적중 {stats['cached_tokens']}토큰, {cached_ratio:.0f}%), "
+            f"출력 {stats['completion_tokens']}토큰, "
+            f"비용 {'단가 미상' if cost is None else f'${cost:.4f}'}, "
+            f"평균 {stats['latency'] / stats['calls'] if stats['calls'] else 0:.1f}초"
+        )
+    if llm_usage:
+        print_progress(f"이번 실행 API 비용 합계: ${total_cost:.4f}")
+
+# 스트리밍 JSON 응답의 점진적 해석
+class PartialJSONObject:
+    """스트리밍 응답 조각을 이어 받으며 최상위 문자열 필드와 문자열 배열 필드를 완성되는 대로 모음
+
+    values에는 완성된 문자열 값과 (닫히지 않았더라도) 지금까지 받은 배열 항목이, completed에는
+    값이 끝난 필드 이름이 들어간다. 더 깊이 중첩된 값은 건너뛴다.
+    """
     
+    def __init__(self):
+        self.values = {}
+        self.completed = set()
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.expect_key = False
+        self.key = None
+        self.buffer = []
+    
+    def feed(self, text):
+        """응답 조각 하나를 이어서 해석"""
+        for char in text:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+                    self._end_string("".join(self.buffer))
+                    continue
+                self.buffer.append(char)
+            elif char == '"':
+                self.in_string = True
+                self.buffer = []
+            elif char in "{[":
+                self.depth += 1
+                if self.depth == 1:
+                    self.expect_key = True
+                elif self.depth == 2 and char == "[" and self.key is not None:
+                    self.values[self.key] = []
+            elif char in "}]":
+                if self.depth == 2 and isinstance(self.values.get(self.key), list):
+                    self.completed.add(self.key)
+                self.depth -= 1
+            elif self.depth == 1 and char == ",":
+                self.expect_key = True
+            elif self.depth == 1 and char == ":":
+                self.expect_key = False
+    
+    def _end_string(self, raw):
+        """닫힌 문자열을 키, 필드 값, 배열 항목 중 하나로 기록"""
+        try:
+            text = json.loads(f'"{raw}"')
+        except ValueError:
+            text = raw
+        
+        if self.depth == 1 and self.expect_key:
+            self.key = text
+        elif self.depth == 1:
+            self.values[self.key] = text
+            self.completed.add(self.key)
+        elif self.depth == 2 and isinstance(self.values.get(self.key), list):
+            self.values[self.key].append(text)
+
+# 스트리밍으로 응답 받기
+def stream_json_completion(model, messages, temperature, request_options, abort_check):
+    """응답 조각마다 abort_check(PartialJSONObject)를 호출하고, 이유를 반환하면 스트림을 끊음
+
+    (응답 원문, 중단 이유 또는 None, usage 또는 None) 반환
+    """
+    partial = PartialJSONObject()
+    chunks = []
+    usage = None
+    stream = client.chat.completions.create(
+        model=model,
+        messages=messages,
+        temperature=temperature,
+        stream=True,
+        stream_options={"include_usage": True},
+        **request_options
+    )
     try:
+        for chunk in stream:
+            if chunk.usage:
+                usage = chunk.usage
+            if not chunk.choices or not chunk.choices[0].delta.content:
+                continue
+            
+            text = chunk.choices[0].delta.content
+            chunks.append(text)
+            partial.feed(text)
+            abort_reason = abort_check(partial)
+            if abort_reason:
+                return "".join(chunks), abort_reason, usage
+    finally:
+        stream.close()
+    
+    return "".join(chunks), None, usage
+
+# 캐시를 거쳐 GPT에 JSON 응답 요청
+def cached_json_completion(stage, model, system_prompt, prompt, temperature, max_tokens=None, schema=None, abort_check=None):
+    """캐시에 없을 때만 API를 호출하여 (응답 원문, 파싱된 JSON) 반환
+
+    지원하는 모델은 JSON 모드로 요청하고, 응답이 schema(RESPONSE_SCHEMAS의 이름)에 맞지 않으면
+    버리지 않고 형식 복구를 한 번 시도한다. abort_check가 있으면 스트리밍으로 받으면서
+    쓸 수 없는 응답임이 확정되는 즉시 끊고 파싱 결과 None을 반환한다 (캐시하지 않음).
+    """
+    cache_key = llm_cache_key(model, system_prompt, prompt, temperature, max_tokens)
+    if llm_cache is not None:
+        cached = llm_cache.get(cache_key)
+        if cached is not None:
+            count_llm_event(stage, model, "cache_hits")
+            return cached["raw"], cached["parsed"]
+    
+    request_options = {"max_tokens": max_tokens} if max_tokens else {}
+    if model in JSON_MODE_MODELS:
+        request_options["response_format"] = {"type": "json_object"}
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": prompt}
+    ]
+    request_started = time.time()
+    if abort_check:
+        response_text, abort_reason, usage = stream_json_completion(model, messages, temperature, request_options, abort_check)
+        estimated_tokens = (count_tokens(system_prompt) + count_tokens(prompt), count_tokens(response_text))
+        record_llm_usage(stage, model, usage, time.time() - request_started, estimated_tokens)
+        if abort_reason:
+            print_progress(f"응답 수신 조기 중단: {abort_reason} ({len(response_text)}자 수신)")
+            return response_text, None
+    else:
         response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.2
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            **request_options
         )
+        record_llm_usage(stage, model, response.usage, time.time() - request_started)
+        response_text = response.choices[0].message.content
+    
+    response_text = response_text.strip()
+    parsed = parse_json_response(response_text)
+    
+    # 형식이 맞지 않으면 유료 응답을 버리지 않고 복구 시도
+    errors = validate_response(parsed, schema)
+    if errors:
+        parsed = repair_json_response(response_text, schema, errors)
+    
+    # 파싱에 성공한 응답만 저장 (실패한 응답은 다음 실행에서 다시 요청)
+    if parsed is not None and llm_cache is not None:
+        llm_cache.set(cache_key, {"raw": response_text, "parsed": parsed})
+    
+    return response_text, parsed
+
+# 단계별 모델 승급 순서에 따라 JSON 응답 요청
+def routed_json_completion(stage, system_prompt, prompt, temperature, max_tokens=None, schema=None, abort_check=None, accept=None):
+    """STAGE_MODELS[stage]의 모델을 차례로 시도하여 (응답 원문, 파싱된 JSON) 반환
+
+    요청이 실패했거나(속도 제한, 시간 초과, 사용할 수 없는 모델 등) 응답을 파싱하지 못했거나
+    accept(결과)가 거짓이면 다음 모델로 승급한다. 마지막 모델의 응답은 그대로 반환하고,
+    마지막 모델의 요청까지 실패하면 그 예외를 다시 발생시킨다.
+    """
+    models = STAGE_MODELS[stage]
+    for level, model in enumerate(models):
+        last_model = level == len(models) - 1
+        try:
+            response_text, parsed = cached_json_completion(
+                stage, model, system_prompt, prompt, temperature,
+                max_tokens=max_tokens, schema=schema, abort_check=abort_check
+            )
+        except Exception as e:
+            count_llm_event(stage, model, "errors")
+            if last_model:
+                raise
+            print_progress(f"{model} 요청 오류 ({e}), {models[level + 1]} 모델로 다시 요청")
+            continue
         
-        response_text = response.choices[0].message.content.strip()
+        if last_model or (parsed is not None and (accept is None or accept(parsed))):
+            return response_text, parsed
         
-        # JSON 추출
-        json_match = re.search(r'(\{.*\})', response_text, re.DOTALL)
-        if json_match:
-            try:
-                return json.loads(json_match.group(1))
-            except json.JSONDecodeError:
-                print_progress(f"JSON 파싱 오류: {response_text[:100]}...")
-                return None
-        else:
-            print_progress(f"JSON 형식 응답 없음: {response_text[:100]}...")
-            return None
-            
+        count_llm_event(stage, model, "rejected")
+        print_progress(f"{model} 응답 불합격, {models[level + 1]} 모델로 다시 요청")
+
+# 단계별 모델로 JSON 응답 얻기 (유틸리티 함수)
+def llm_json_request(stage, prompt, system_prompt=None, schema=None):
+    """단계에 설정된 모델에 요청하여 JSON 형태의 응답 반환"""
+    if not system_prompt:
+        system_prompt = "당신은 팩트체크 및 데이터 분석 전문가입니다. 주어진 질문에 대해 정확하고 객관적인 JSON 응답을 제공합니다."
+    
+    try:
+        _, result = routed_json_completion(stage, system_prompt, prompt, temperature=0.2, schema=schema)
+        return result
     except Exception as e:
-        print_progress(f"GPT-3.5 요청 오류: {e}")
+        print_progress(f"{stage} 단계 LLM 요청 오류: {e}")
         return None
 
 # 초기 설정 함수
 def initialize():
     """초기 설정 및 캐시 로드"""
-    global search_cache
+    global search_cache, search_fingerprints, llm_cache, page_cache
+    try:
+        # LLM 응답 캐시 연결 및 만료 항목 정리
+        llm_cache = PersistentCache(CACHE_DB_FILE, "llm_responses", LLM_CACHE_TTL_SECONDS, LLM_CACHE_MAX_ENTRIES)
+        removed = llm_cache.evict()
+        print_progress(f"LLM 응답 캐시 {len(llm_cache)}개 항목 로드 완료 ({removed}개 정리)")
+    except Exception as e:
+        print_progress(f"LLM 캐시 로드 오류: {e}")
+        llm_cache = None
+    
     try:
-        # 검색 캐시 로드
-        if os.path.exists(SEARCH_CACHE_FILE):
-            with open(SEARCH_CACHE_FILE, 'r', encoding='utf-8') as f:
-                search_cache = json.load(f)
-            print_progress(f"검색 캐시 {len(search_cache)}개 항목 로드 완료")
+        # 기사 페이지 캐시 연결 및 만료 항목 정리
+        page_cache = PersistentCache(CACHE_DB_FILE, "pages", PAGE_CACHE_TTL_SECONDS, PAGE_CACHE_MAX_ENTRIES, compress=True)
+        removed = page_cache.evict()
+        print_progress(f"기사 페이지 캐시 {len(page_cache)}개 항목 로드 완료 ({removed}개 정리)")
+    except Exception as e:
+        print_progress(f"페이지 캐시 로드 오류: {e}")
+        page_cache = None
+    
+    try:
+        # 검색 캐시 연결
+        search_cache = PersistentCache(CACHE_DB_FILE, "search_results", SEARCH_CACHE_TTL_SECONDS, SEARCH_CACHE_MAX_ENTRIES)
+        print_progress(f"검색 캐시 {len(search_cache)}개 항목 연결 완료")
     except Exception as e:
         print_progress(f"캐시 로드 오류: {e}")
-        search_cache = {}
-
-# 캐시 저장 함수
-def save_cache():
-    """검색 캐시 저장"""
+        search_cache = None
+    
     try:
-        with open(SEARCH_CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(search_cache, f, ensure_ascii=False)
-        print_progress(f"검색 캐시 {len(search_cache)}개 항목 저장 완료")
+        # 유사 발언 색인 연결
+        if search_cache is not None and SEARCH_NEAR_DUPLICATE:
+            search_fingerprints = MinHashIndex(CACHE_DB_FILE, "search_fingerprints")
     except Exception as e:
-        print_progress(f"캐시 저장 오류: {e}")
+        print_progress(f"유사 발언 색인 로드 오류: {e}")
+        search_fingerprints = None
+
+# 캐시 상태 출력 함수
+def save_cache():
+    """검색 캐시 통계 출력 (항목은 조회/저장 시점에 바로 기록됨)"""
+    if search_cache is not None:
+        print_progress(search_cache.stats_message("검색"))
 
-# 네이버 뉴스 API를 사용하여 정치 뉴스 가져오기
-def get_naver_news():
+# 네이버 뉴스 API 단일 검색 요청 (공유 세션 + 속도 제한)
+def fetch_naver_news_items(query, display, headers):
+    """네이버 뉴스 API 검색 결과 항목 반환"""
+    naver_rate_limiter.acquire()
+    response = http_session.get(
+        NAVER_NEWS_API_URL,
+        headers=headers,
+        params={"query": query, "display": display, "sort": "date"},
+        timeout=5
+    )
+    response.raise_for_status()
+    return response.json().get("items", [])
+
+# 네이버 뉴스 검색 결과를 중복 제거하여 병합
+def merge_naver_news_items(news_items, politician=None):
+    """중복/블랙리스트 항목을 제외하고 뉴스 데이터로 변환"""
+    merged = []
+    for item in news_items:
+        # 중복 방지
+        if item['link'] in processed_urls:
+            continue
+            
+        # HTML 태그 제거
+        title = re.sub('<[^<]+?>', '', item['title'])
+        if title in processed_titles:
+            continue
+            
+        # 블랙리스트 체크
+        if "blacklist" in KEYWORD_MATCHER.categories(title):
+            continue
+            
+        description = re.sub('<[^<]+?>', '', item['description'])
+        
+        news_data = {
+            "title": title,
+            "url": item['link'],
+            "content": description,
+            "source": item['pubDate']
+        }
+        if politician:
+            news_data["politician"] = politician
+        merged.append(news_data)
+        processed_urls.add(item['link'])
+        processed_titles.add(title)
+    return merged
+
+# 네이버 뉴스 API를 사용하여 정치 뉴스를 가져오는 즉시 하나씩 반환
+def iter_naver_news():
+    """네이버 뉴스 검색을 병렬로 요청하고 제출 순서대로 기사를 하나씩 생성"""
     print_progress("네이버 뉴스 API에서 기사 가져오는 중...")
     
     if not NAVER_CLIENT_ID or not NAVER_CLIENT_SECRET:
         print_progress("네이버 API 인증 정보가 없습니다. 네이버 뉴스 API를 건너뜁니다.")
-        return []
+        return
     
     headers = {
         "X-Naver-Client-Id": NAVER_CLIENT_ID,
@@ -251,102 +1074,82 @@ def get_naver_news():
         "정치 논란", "정치 공방", "정치 비판"
     ]
     
-    all_news = []
+    # 검색 목록: (쿼리, 결과 수, 정치인, 로그 라벨)
+    searches = [(f"{name} 발언", 15, name, f"{name} 관련 뉴스") for name in politician_names]
+    searches += [(f"정치인 {keyword}", 10, None, f"키워드 '{keyword}' 관련 뉴스") for keyword in politics_keywords]
     
-    # 정치인 이름으로 검색
-    for name in politician_names:
-        try:
-            url = f"https://openapi.naver.com/v1/search/news.json?query={name}+발언&display=15&sort=date"
-            response = requests.get(url, headers=headers)
-            
-            if response.status_code == 200:
-                result = response.json()
-                news_items = result.get("items", [])
-                print_progress(f"{name} 관련 뉴스 {len(news_items)}개 발견")
-                
-                for item in news_items:
-                    # 중복 방지
-                    if item['link'] in processed_urls:
-                        continue
-                        
-                    # HTML 태그 제거
-                    title = re.sub('<[^<]+?>', '', item['title'])
-                    if title in processed_titles:
-                        continue
-                        
-                    # 블랙리스트 체크
-                    if any(keyword in title.lower() for keyword in BLACKLIST_KEYWORDS):
-                        continue
-                        
-                    description = re.sub('<[^<]+?>', '', item['description'])
-                    
-                    news_data = {
-                        "title": title,
-                        "url": item['link'],
-                        "content": description,
-                        "source": item['pubDate'],
-                        "politician": name
-                    }
-                    all_news.append(news_data)
-                    processed_urls.add(item['link'])
-                    processed_titles.add(title)
-            else:
-                print_progress(f"{name} 관련 뉴스 가져오기 실패: {response.status_code}")
-                
-            # API 호출 간격
-            time.sleep(0.1)
-            
-        except Exception as e:
-            print_progress(f"{name} 관련 뉴스 가져오기 오류: {e}")
+    total = 0
     
-    # 정치 키워드로 검색
-    for keyword in politics_keywords:
-        try:
-            url = f"https://openapi.naver.com/v1/search/news.json?query=정치인+{keyword}&display=10&sort=date"
-            response = requests.get(url, headers=headers)
-            
-            if response.status_code == 200:
-                result = response.json()
-                news_items = result.get("items", [])
-                print_progress(f"키워드 '{keyword}' 관련 뉴스 {len(news_items)}개 발견")
-                
-                for item in news_items:
-                    # 중복 방지
-                    if item['link'] in processed_urls:
-                        continue
-                        
-                    title = re.sub('<[^<]+?>', '', item['title'])
-                    if title in processed_titles:
-                        continue
-                        
-                    # 블랙리스트 체크
-                    if any(keyword in title.lower() for keyword in BLACKLIST_KEYWORDS):
-                        continue
-                        
-                    description = re.sub('<[^<]+?>', '', item['description'])
-                    news_data = {
-                        "title": title,
-                        "url": item['link'],
-                        "content": description,
-                        "source": item['pubDate']
-                    }
-                    all_news.append(news_data)
-                    processed_urls.add(item['link'])
-                    processed_titles.add(title)
-            else:
-                print_progress(f"키워드 '{keyword}' 검색 실패: {response.status_code}")
-                
-            # API 호출 간격
-            time.sleep(0.1)
+    # 동시 요청 수와 초당 요청 수를 제한하여 병렬 검색 (소비가 멈추면 남은 요청은 취소)
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=NAVER_MAX_CONCURRENCY)
+    try:
+        futures = [
+            executor.submit(fetch_naver_news_items, query, display, headers)
+            for query, display, _, _ in searches
+        ]
+        
+        # 제출 순서대로 병합하여 결과를 결정적으로 유지
+        for (query, display, politician, label), future in zip(searches, futures):
+            try:
+                news_items = future.result()
+                print_progress(f"{label} {len(news_items)}개 발견")
+                merged = merge_naver_news_items(news_items, politician)
+            except Exception as e:
+                print_progress(f"{label} 가져오기 오류: {e}")
+                continue
             
-        except Exception as e:
-            print_progress(f"키워드 '{keyword}' 검색 오류: {e}")
+            total += len(merged)
+            yield from merged
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
     
-    print_progress(f"네이버에서 총 {len(all_news)}개 뉴스 기사 가져옴")
-    return all_news
+    print_progress(f"네이버에서 총 {total}개 뉴스 기사 가져옴")
+
+# RSS 피드 조건부 요청 상태 로드
+def load_rss_feed_state():
+    """피드별 ETag/Last-Modified 값 로드"""
+    try:
+        if os.path.exists(RSS_STATE_FILE):
+            with open(RSS_STATE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+    except Exception as e:
+        print_progress(f"RSS 상태 로드 오류: {e}")
+    return {}
+
+# RSS 피드 조건부 요청 상태 저장
+def save_rss_feed_state(feed_state):
+    """피드별 ETag/Last-Modified 값 저장"""
+    try:
+        with open(RSS_STATE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(feed_state, f, ensure_ascii=False)
+    except Exception as e:
+        print_progress(f"RSS 상태 저장 오류: {e}")
+
+# 조건부 GET으로 RSS 피드 가져오기
+def fetch_rss_feed(feed_url, validators):
+    """변경된 피드만 내려받아 파싱 (변경 없으면 피드 대신 None 반환)"""
+    headers = {"User-Agent": USER_AGENT}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    
+    response = http_session.get(feed_url, headers=headers, timeout=10)
+    if response.status_code == 304:
+        return None, validators
+    response.raise_for_status()
+    
+    new_validators = {}
+    if response.headers.get("ETag"):
+        new_validators["etag"] = response.headers["ETag"]
+    if response.headers.get("Last-Modified"):
+        new_validators["last_modified"] = response.headers["Last-Modified"]
+    
+    return feedparser.parse(response.content), new_validators
 
-# RSS 피드에서 뉴스 수집
-def collect_rss_news():
+# RSS 피드에서 뉴스를 수집하는 즉시 하나씩 반환
+def iter_rss_news():
+    """RSS 피드를 병렬로 조건부 요청하고 피드 순서대로 기사를 하나씩 생성"""
     print_progress("RSS 피드에서 뉴스 수집 중...")
     
     # 주요 한국 뉴스 사이트의 정치 RSS 피드
@@ -358,97 +1161,348 @@ def collect_rss_news():
         "https://www.ytn.co.kr/_ln/0101_rss.xml"               # YTN 정치
     ]
     
-    # 수집된 기사 저장
-    all_statements = []
+    feed_state = load_rss_feed_state()
+    seen_urls = set()
+    seen_titles = set()
+    total = 0
     
-    for feed_url in rss_feeds:
-        try:
-            feed = feedparser.parse(feed_url)
-            print_progress(f"피드 {feed_url}에서 {len(feed.entries)}개 항목 발견")
+    # 피드 요청과 요약 추출은 각각 제한된 작업자 풀에서 수행 (소비가 멈추면 남은 작업은 취소)
+    feed_executor = concurrent.futures.ThreadPoolExecutor(max_workers=RSS_MAX_CONCURRENCY)
+    summary_executor = concurrent.futures.ThreadPoolExecutor(max_workers=RSS_SUMMARY_WORKERS)
+    try:
+        futures = [
+            feed_executor.submit(fetch_rss_feed, feed_url, feed_state.get(feed_url, {}))
+            for feed_url in rss_feeds
+        ]
+        
+        # 피드 순서대로 결과 정리
+        for feed_url, future in zip(rss_feeds, futures):
+            try:
+                feed, validators = future.result()
+                if feed is None:
+                    feed_state[feed_url] = validators
+                    print_progress(f"피드 {feed_url} 변경 없음 (304)")
+                    continue
+                print_progress(f"피드 {feed_url}에서 {len(feed.entries)}개 항목 발견")
+            except Exception as e:
+                print_progress(f"피드 {feed_url} 처리 오류: {e}")
+                continue
+            
+            source = feed.feed.title if hasattr(feed, 'feed') and hasattr(feed.feed, 'title') else "뉴스 소스"
+            
+            # 피드의 기사 후보 (요약이 필요한 항목은 먼저 요약 추출을 제출)
+            candidates = []
             
             # 항목 수 제한 (20개)
             for entry in feed.entries[:20]:
                 # 중복 방지
-                if entry.link in processed_urls:
+                if entry.link in processed_urls or entry.link in seen_urls:
                     continue
                     
-                if hasattr(entry, 'title') and entry.title in processed_titles:
+                if hasattr(entry, 'title') and (entry.title in processed_titles or entry.title in seen_titles):
                     continue
                     
                 # 블랙리스트 체크
-                if any(keyword in entry.title.lower() for keyword in BLACKLIST_KEYWORDS):
+                title_categories = KEYWORD_MATCHER.categories(entry.title)
+                if "blacklist" in title_categories:
                     continue
                     
                 # 기본 정보 추출
                 statement_data = {
                     "title": entry.title,
                     "url": entry.link,
-                    "source": feed.feed.title if hasattr(feed, 'feed') and hasattr(feed.feed, 'title') else "뉴스 소스"
+                    "source": source
                 }
+                summary_future = None
                 
                 # 기사 본문 추출은 필요한 경우에만 수행
-                if is_likely_political(entry.title):
+                if "political" in title_categories:
+                    # 간략 내용 추출
+                    if hasattr(entry, 'summary'):
+                        statement_data["content"] = entry.summary
+                    elif hasattr(entry, 'description'):
+                        statement_data["content"] = entry.description
+                    elif (time.time() - start_time) > (MAX_RUNTIME_SECONDS / 3):
+                        # 실행 시간 체크 - 제한 시간의 1/3을 넘으면 요약 추출 생략
+                        continue
+                    else:
+                        # URL에서 간략 내용 가져오기 (작업자 풀에서 병렬 처리)
+                        summary_future = summary_executor.submit(get_article_summary, entry.link)
+                
+                candidates.append((statement_data, summary_future))
+                seen_urls.add(entry.link)
+                seen_titles.add(entry.title)
+            
+            # 피드 순서대로 결과 생성
+            for statement_data, summary_future in candidates:
+                if summary_future is not None:
                     try:
-                        # 간략 내용 추출
-                        if hasattr(entry, 'summary'):
-                            statement_data["content"] = entry.summary
-                        elif hasattr(entry, 'description'):
-                            statement_data["content"] = entry.description
-                        else:
-                            # URL에서 간략 내용 가져오기
-                            article_content = get_article_summary(entry.link)
-                            if article_content:
-                                statement_data["content"] = article_content
-                            else:
-                                continue  # 내용이 없으면 건너뛰기
+                        article_content = summary_future.result()
                     except Exception as e:
                         print_progress(f"기사 내용 가져오기 오류: {e}")
-                        continue  # 내용 추출 실패 시 건너뛰기
+                        article_content = ""
+                    if not article_content:
+                        continue  # 내용이 없으면 건너뛰기
+                    statement_data["content"] = article_content
                 
-                all_statements.append(statement_data)
-                processed_urls.add(entry.link)
-                processed_titles.add(entry.title)
-        
-        except Exception as e:
-            print_progress(f"피드 {feed_url} 처리 오류: {e}")
+                processed_urls.add(statement_data["url"])
+                processed_titles.add(statement_data["title"])
+                total += 1
+                yield statement_data
+            
+            # 피드의 기사를 모두 내보낸 뒤에만 새 검증자 저장 (중간에 수집이 멈추면 이전 검증자를 유지하여
+            # 다음 실행에서 304로 남은 기사를 놓치지 않도록 함)
+            feed_state[feed_url] = validators
+    finally:
+        feed_executor.shutdown(wait=False, cancel_futures=True)
+        summary_executor.shutdown(wait=False, cancel_futures=True)
+        save_rss_feed_state(feed_state)
+    
+    print_progress(f"RSS에서 총 {total}개 뉴스 기사 가져옴")
+
+# 응답 문자셋 결정
+def response_charset(response, first_chunk):
+    """Content-Type 헤더, 없으면 문서 앞부분의 <meta charset>으로 문자셋 결정 (기본 UTF-8)"""
+    match = re.search(r'charset=["\']?([\w-]+)', response.headers.get("Content-Type", ""), re.IGNORECASE)
+    if match:
+        charset = match.group(1)
+    else:
+        match = re.search(rb'<meta[^>]+charset=["\']?([\w-]+)', first_chunk[:4096], re.IGNORECASE)
+        charset = match.group(1).decode('ascii') if match else "utf-8"
+    
+    charset = CHARSET_ALIASES.get(charset.lower(), charset)
+    try:
+        return codecs.lookup(charset).name
+    except LookupError:
+        return "utf-8"
+
+# 본문 요소 닫힘 감지
+class ContainerEndScanner:
+    """내려받는 중인 HTML에서 사이트 본문 요소의 시작을 찾고, 같은 태그의 중첩 깊이를 세어 닫히는 시점을 감지"""
+
+    def __init__(self, candidates):
+        self.start_patterns = [
+            (tag, re.compile(
+                # 속성 이름 앞에 공백을 요구하여 data-id=, data-class= 같은 속성과 구분
+                rf'<{tag}\b[^>]*\s{attribute}\s*=\s*["\']?(?:[^"\'>]*\s)?{re.escape(value)}(?=["\'\s>])',
+                re.IGNORECASE
+            ))
+            for tag, attribute, value in candidates
+        ]
+        self.tag_pattern = None
+        self.depth = 0
+        self.position = 0
+
+    def closed(self, text):
+        """지금까지 받은 텍스트에서 본문 요소가 닫혔는지 여부"""
+        if self.tag_pattern is None:
+            for tag, pattern in self.start_patterns:
+                match = pattern.search(text, max(0, self.position - 256))
+                if match:
+                    self.tag_pattern = re.compile(rf'<(/?){tag}\b', re.IGNORECASE)
+                    self.depth = 1
+                    self.position = match.end()
+                    break
+            else:
+                self.position = len(text)
+                return False
         
-        # 실행 시간 체크 - 제한 시간의 1/3을 넘으면 중단
-        if (time.time() - start_time) > (MAX_RUNTIME_SECONDS / 3):
-            print_progress("시간 제한 임박, 남은 RSS 피드 건너뜁니다")
-            break
+        # 태그가 청크 경계에서 잘려도 다음에 다시 검사하도록 마지막으로 찾은 태그 뒤부터 검사
+        for match in self.tag_pattern.finditer(text, self.position):
+            self.depth += -1 if match.group(1) else 1
+            self.position = match.end()
+            if self.depth == 0:
+                return True
+        return False
+
+# 기사 페이지 스트리밍 다운로드
+def download_page(url, headers, head_only):
+    """크기 제한을 두고 조금씩 읽으며 디코딩, </head> 또는 본문 요소가 닫히면 중단 (변경 없으면 None)
+
+    반환 값의 truncated는 중단 이유: None(끝까지 읽음), "head", "body", "cap"(크기 제한)
+    """
+    rule = None if head_only else site_extraction_rule(url)
+    scanner = ContainerEndScanner(rule) if rule else None
     
-    print_progress(f"RSS에서 총 {len(all_statements)}개 뉴스 기사 가져옴")
-    return all_statements
+    with http_session.get(url, headers=headers, timeout=5, stream=True) as response:
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+        
+        decoder = None
+        text = ""
+        size = 0
+        truncated = None
+        
+        for chunk in response.iter_content(chunk_size=PAGE_CHUNK_BYTES):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(response_charset(response, chunk))(errors="replace")
+            
+            scan_from = max(0, len(text) - 16)
+            text += decoder.decode(chunk)
+            size += len(chunk)
+            
+            if head_only and text.lower().find("</head>", scan_from) >= 0:
+                truncated = "head"
+                break
+            if scanner and scanner.closed(text):
+                truncated = "body"
+                break
+            if size >= PAGE_MAX_BYTES:
+                truncated = "cap"
+                break
+        else:
+            if decoder is not None:
+                text += decoder.decode(b"", final=True)
+        
+        return {
+            "html": text,
+            "truncated": truncated,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified")
+        }
 
-# 정치 관련 기사인지 빠르게 확인
-def is_likely_political(title):
-    political_keywords = [
-        "대통령", "국회", "의원", "정부", "청와대", "여당", "야당", "정책", "장관",
-        "민주당", "국민의힘", "위원장", "대표", "대선", "총선", "선거",
-        "윤석열", "이재명", "홍준표", "한동훈", "조국"
-    ]
-    return any(keyword in title for keyword in political_keywords)
+# 기사 페이지 HTML 가져오기 (압축 페이지 캐시 + 조건부 GET)
+def fetch_page(url, head_only=False):
+    """캐시된 페이지는 ETag/Last-Modified로 변경 여부만 확인하고, 변경된 경우에만 내려받음
+
+    head_only이면 <head>까지만 읽는다. <head>까지만 캐시된 페이지는 본문이 필요한 요청에 쓰지 않고,
+    본문까지 캐시된 페이지를 <head>까지만 받은 페이지로 덮어쓰지 않는다.
+    """
+    cached = page_cache.get(url) if page_cache is not None else None
+    if cached and not head_only and cached.get("truncated") == "head":
+        cached = None
+    headers = {"User-Agent": USER_AGENT}
+    
+    if cached:
+        # 검증 값이 없는 페이지는 캐시 유효 기간 동안 그대로 사용
+        if not cached.get("etag") and not cached.get("last_modified"):
+            return cached["html"]
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    
+    page = download_page(url, headers, head_only)
+    if page is None:
+        if cached:
+            return cached["html"]
+        raise requests.HTTPError(f"304 응답이지만 캐시된 페이지 없음: {url}")
+    
+    if page["truncated"]:
+        print_progress(f"페이지 일부만 내려받음 ({page['truncated']}, {len(page['html'])}자): {url}")
+    # 본문이 있는 캐시를 <head>까지만 받은 페이지로 바꾸면 이후 본문 요청이 매번 전체를 다시 받게 됨
+    keeps_cached_body = page["truncated"] == "head" and cached and cached.get("truncated") != "head"
+    if page_cache is not None and not keeps_cached_body:
+        page_cache.set(url, page)
+    return page["html"]
+
+# 사이트 도메인 확인
+def site_extraction_rule(url):
+    """URL 호스트에 맞는 사이트별 추출 규칙 (없으면 None)"""
+    hostname = (urlparse(url).hostname or "").lower()
+    for domain, rule in SITE_EXTRACTION_RULES.items():
+        if hostname == domain or hostname.endswith("." + domain):
+            return rule
+    return None
+
+# 본문 요소의 텍스트 정리
+def article_body_text(article_body):
+    """광고, 기자 정보 등 불필요한 요소를 제거한 본문 텍스트"""
+    for tag in article_body.select(ARTICLE_NOISE_SELECTOR):
+        tag.decompose()
+    return article_body.get_text(strip=True, separator=' ')
+
+# 기사 페이지에서 요약 추출
+def extract_article_summary(page_html):
+    """<head>의 메타 설명만 파싱하고, 없을 때만 본문에서 첫 단락을 찾음"""
+    head_end = page_html.lower().find("</head>")
+    head_html = page_html[:head_end] if head_end >= 0 else page_html
+    
+    head = BeautifulSoup(head_html, HTML_PARSER, parse_only=SoupStrainer("meta", attrs={"name": "description"}))
+    meta_desc = head.find("meta")
+    if meta_desc and meta_desc.get('content'):
+        return meta_desc.get('content')
+    
+    # 메타 설명이 없으면 첫 단락만 추출
+    paragraphs = BeautifulSoup(page_html, HTML_PARSER, parse_only=SoupStrainer("p"))
+    first_paragraph = paragraphs.find("p")
+    return first_paragraph.get_text(strip=True) if first_paragraph else ""
+
+# 기사 페이지에서 전체 본문 추출
+def extract_article_content(url, page_html):
+    """사이트별 규칙이 있으면 본문 요소만 파싱하고, 없거나 실패하면 전체 페이지에서 일반 선택자로 추출"""
+    for tag, attribute, value in site_extraction_rule(url) or []:
+        # 여러 클래스가 붙은 요소도 찾도록 class는 패턴으로 비교 (SoupStrainer는 파싱 중 class 값을 문자열 그대로 비교)
+        attrs = {attribute: re.compile(rf"(^|\s){re.escape(value)}(\s|$)") if attribute == "class" else value}
+        strained = BeautifulSoup(page_html, HTML_PARSER, parse_only=SoupStrainer(tag, attrs=attrs))
+        article_body = strained.find(tag, attrs=attrs)
+        if article_body:
+            return article_body_text(article_body)
+    
+    soup = BeautifulSoup(page_html, HTML_PARSER)
+    
+    # 본문 추출 시도 (여러 뉴스 사이트 지원)
+    for selector in ARTICLE_SELECTORS:
+        article_body = soup.select_one(selector)
+        if article_body:
+            return article_body_text(article_body)
+    
+    # 선택자로 찾지 못한 경우 메타 설명 사용
+    meta_desc = soup.select_one('meta[name="description"]')
+    if meta_desc and meta_desc.get('content'):
+        return meta_desc.get('content')
+    
+    # 그래도 없으면 제목 + 첫 단락
+    title = soup.select_one('title')
+    first_p = soup.select_one('p')
+    
+    content = ""
+    if title:
+        content += title.get_text(strip=True) + ". "
+    if first_p:
+        content += first_p.get_text(strip=True)
+    
+    return content
+
+# 실행 중 기사 조회 결과 ((URL, <head>만 여부)별 Future - 동시 요청 합치기와 실행 단위 메모 역할)
+article_fetches = {}
+article_fetches_lock = threading.Lock()
+
+# 기사 페이지를 실행당 한 번만 내려받음
+def fetch_article(url, head_only=False):
+    """같은 URL을 동시에 요청하면 먼저 시작한 요청의 결과를 함께 기다림 (추출 결과도 이 레코드에 저장)
+
+    본문까지 받은 페이지가 있으면 <head>만 필요한 요청도 그 페이지를 사용한다.
+    """
+    with article_fetches_lock:
+        future = article_fetches.get((url, False)) or article_fetches.get((url, head_only))
+        is_owner = future is None
+        if is_owner:
+            future = concurrent.futures.Future()
+            article_fetches[(url, head_only)] = future
+    
+    if is_owner:
+        try:
+            future.set_result({"html": fetch_page(url, head_only=head_only)})
+        except Exception as e:
+            future.set_exception(e)
+    
+    return future.result()
 
 # 기사 URL에서 요약 내용만 추출
 def get_article_summary(url):
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        }
-        response = requests.get(url, headers=headers, timeout=5)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        article = fetch_article(url, head_only=True)
+        if "summary" not in article:
+            article["summary"] = extract_article_summary(article["html"])
         
-        # 메타 설명 추출
-        meta_desc = soup.select_one('meta[name="description"]')
-        if meta_desc and meta_desc.get('content'):
-            return meta_desc.get('content')
-            
-        # 메타 설명이 없으면 첫 단락만 추출
-        first_paragraph = soup.select_one('p')
-        if first_paragraph:
-            return first_paragraph.get_text(strip=True)
-            
-        return ""
+        # <head>에 메타 설명이 없으면 본문까지 받아 첫 단락 사용
+        if not article["summary"]:
+            article = fetch_article(url)
+            if "summary" not in article:
+                article["summary"] = extract_article_summary(article["html"])
+        return article["summary"]
     except Exception as e:
         print_progress(f"기사 요약 추출 오류: {e}")
         return ""
@@ -456,113 +1510,55 @@ def get_article_summary(url):
 # 기사 URL에서 전체 내용 추출
 def get_full_article_content(url):
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        }
-        response = requests.get(url, headers=headers, timeout=5)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # 본문 추출 시도 (여러 뉴스 사이트 지원)
-        article_selectors = [
-            'article', '.article_body', '#articleBody', 
-            '.news_view', '.article-body', '.article-content',
-            '#article-view-content-div', '.article_cont', '.news_contents',
-            '.newsct_article', '#news_body_area', '.article_txt', '#article'
-        ]
-        
-        for selector in article_selectors:
-            article_body = soup.select_one(selector)
-            if article_body:
-                # 불필요한 요소 제거
-                for tag in article_body.select('.reporter_area, .byline, .share_area, .article_ad, script, style'):
-                    tag.decompose()
-                
-                article_text = article_body.get_text(strip=True, separator=' ')
-                return article_text
-                
-        # 선택자로 찾지 못한 경우 메타 설명 사용
-        meta_desc = soup.select_one('meta[name="description"]')
-        if meta_desc and meta_desc.get('content'):
-            return meta_desc.get('content')
-            
-        # 그래도 없으면 제목 + 첫 단락
-        title = soup.select_one('title')
-        first_p = soup.select_one('p')
-        
-        content = ""
-        if title:
-            content += title.get_text(strip=True) + ". "
-        if first_p:
-            content += first_p.get_text(strip=True)
-            
-        return content
+        article = fetch_article(url)
+        if "content" not in article:
+            article["content"] = extract_article_content(url, article["html"])
+        return article["content"]
     except Exception as e:
         print_progress(f"전체 기사 내용 추출 오류: {e}")
         return ""
 
-# 정치인 발언 수집 통합 함수
-def collect_politician_statements():
+# 정치인 발언을 수집하는 즉시 규칙 기반 필터를 거쳐 하나씩 반환
+def iter_politician_statements():
+    """네이버 뉴스 → RSS 순으로 수집하며 빠른 필터를 통과한 기사를 생성 (개수 제한은 사전 스크리닝에서 적용)"""
     print_progress("정치인 발언 수집 시작...")
     
+    passed = 0
+    
     # 네이버 뉴스 API에서 뉴스 수집
-    naver_news = get_naver_news()
+    for article in iter_naver_news():
+        if passes_quick_filter(article):
+            passed += 1
+            yield article
     
     # 실행 시간 확인
     if (time.time() - start_time) > (MAX_RUNTIME_SECONDS / 2):
         print_progress("시간 제한의 절반 도달, RSS 피드 건너뜁니다")
-        all_statements = naver_news
-    else:
-        # RSS 피드에서 뉴스 수집
-        rss_news = collect_rss_news()
-        # 모든 뉴스 통합
-        all_statements = naver_news + rss_news
+        return
     
-    # 빠른 필터링 - 규칙 기반
-    all_statements = quick_filter_statements(all_statements)
-    print_progress(f"빠른 필터링 후: {len(all_statements)}개 기사")
+    # RSS 피드에서 뉴스 수집
+    for article in iter_rss_news():
+        if passes_quick_filter(article):
+            passed += 1
+            yield article
     
-    return all_statements
+    print_progress(f"빠른 필터링 후: {passed}개 기사")
 
-# 빠른 규칙 기반 필터링
-def quick_filter_statements(statements):
-    filtered = []
-    
-    # 정치인 이름 목록
-    politicians = [
-        "윤석열", "이재명", "홍준표", "한동훈", "조국",
-        "이낙연", "우상호", "이준석", "나경원", "김경수"
-    ]
+# 빠른 규칙 기반 필터 (기사 하나)
+def passes_quick_filter(article):
+    title_categories = KEYWORD_MATCHER.categories(article.get('title', ''))
     
-    # 발언/팩트체크 관련 키워드
-    keywords = [
-        "발언", "주장", "말했", "밝혔", "반박", "비판", "지적",
-        "퍼센트", "증가", "감소", "통계", "수치", "사실", "팩트"
-    ]
-    
-    for article in statements:
-        title = article.get('title', '')
-        content = article.get('content', '') if 'content' in article else ''
-        
-        # 정치인 이름 + 발언 키워드 필터링
-        if (any(politician in title + " " + content for politician in politicians) and 
-            any(keyword in title + " " + content for keyword in keywords)):
-            
-            # 팩트체크에 부적합한 패턴 체크
-            if not any(pattern in title.lower() for pattern in ["하겠다", "계획", "예정", "공약", "제안"]):
-                filtered.append(article)
+    # 팩트체크에 부적합한 패턴 체크 (제목 기준)
+    if "future" in title_categories:
+        return False
     
-    # 최대 개수 제한 (효율성)
-    return filtered[:30]
+    # 정치인 이름 + 발언 키워드 필터링
+    categories = title_categories | KEYWORD_MATCHER.categories(article.get('content', ''))
+    return "politician" in categories and "claim" in categories
 
-# 3단계 팩트체크 수행 - 스크리닝, 추출, 검증
-def three_stage_factcheck(article):
-    """3단계 팩트체크 수행: 스크리닝-추출-검증"""
-    
-    # 1단계: 스크리닝 - 팩트체크 가능 여부 판단 (GPT-4 사용)
-    print_progress(f"기사 스크리닝 중: {article.get('title', '')[:50]}...")
-    
-    # 내용이 부족하면 전체 기사 가져오기
-    title = article.get('title', '')
+# 기사 내용 보강
+def expand_article_content(article):
+    """내용이 부족한 기사는 전체 기사를 가져와 원본을 업데이트"""
     content = article.get('content', '')
     url = article.get('url', '')
     
@@ -571,24 +1567,34 @@ def three_stage_factcheck(article):
             print_progress(f"기사 내용이 짧음, 전체 내용 가져오는 중: {url}")
             full_content = get_full_article_content(url)
             if full_content and len(full_content) > len(content):
-                content = full_content
-                article['content'] = content  # 원본 업데이트
-                print_progress(f"전체 내용 가져옴: {len(content)}자")
+                article['content'] = full_content  # 원본 업데이트
+                print_progress(f"전체 내용 가져옴: {len(full_content)}자")
         except Exception as e:
             print_progress(f"전체 내용 가져오기 오류: {e}")
     
-    screening_prompt = f"""
-    다음 기사가 팩트체크에 적합한 정치인의 발언을 포함하는지 평가해주세요:
-    
-    제목: {title}
-    내용: {content[:1000]}
-    
+    return article
+
+# 스크리닝 평가 기준 (단일/일괄 스크리닝 공통)
+SCREENING_CRITERIA = """
     다음 기준으로 평가해주세요:
     1. 구체적 수치나 통계를 포함한 주장이 있는가? (예: "실업률 5% 증가")
     2. 정치인의 직접 인용구가 포함되어 있는가?
     3. 구체적인 사실관계에 대한 주장이 있는가?
     4. 서로 상반되는 정치인들의 주장이 있는가?
+"""
+
+# 1단계: 스크리닝 - 팩트체크 가능 여부 판단 (기사 하나)
+def screen_article_content(article):
+    """보강된 기사 내용으로 팩트체크에 적합한 발언이 있는지 판단 (응답 실패로 판정이 없으면 None)"""
+    title = article.get('title', '')
+    content = article.get('content', '')
+    
+    screening_prompt = f"""
+    다음 기사가 팩트체크에 적합한 정치인의 발언을 포함하는지 평가해주세요:
     
+    제목: {title}
+    내용: {content[:1000]}
+    {SCREENING_CRITERIA}
     JSON 형식으로 응답해주세요:
     {{
         "has_factcheckable_claim": true/false,
@@ -596,18 +1602,87 @@ def three_stage_factcheck(article):
     }}
     """
     
-    screening_result = gpt35_json_request(screening_prompt)  # 비용 절감을 위해 GPT-3.5 사용
+    screening_result = llm_json_request("screening", screening_prompt, schema="screening")
     
-    if not screening_result or not screening_result.get("has_factcheckable_claim", False):
-        reasons = screening_result.get("reasons", ["이유 불명"]) if screening_result else ["응답 실패"]
-        print_progress("기사가 팩트체크에 적합하지 않음: " + ", ".join(reasons))
+    has_claim = screening_result.get("has_factcheckable_claim") if screening_result else None
+    if not isinstance(has_claim, bool):
+        print_progress(f"스크리닝 판정 없음 (응답 실패): {title[:30]}...")
         return None
     
-    # 2단계: 발언자와 발언 추출
+    if not has_claim:
+        reasons = screening_result.get("reasons") or ["이유 불명"]
+        print_progress("기사가 팩트체크에 적합하지 않음: " + ", ".join(map(str, reasons)))
+    
+    return has_claim
+
+# 1단계: 일괄 스크리닝 - 여러 기사를 한 번의 요청으로 판단
+def batch_screen_articles(articles):
+    """여러 기사를 LLM 요청 한 번으로 스크리닝하여 기사 순서대로 적합 여부 목록 반환
+
+    응답을 해석할 수 없거나 판정이 빠진 기사는 기사별 스크리닝으로 대체하며,
+    그래도 판정을 받지 못한 기사는 None이다.
+    """
+    if len(articles) == 1:
+        return [screen_article_content(articles[0])]
+    
+    print_progress(f"기사 {len(articles)}개 일괄 스크리닝 중...")
+    
+    articles_text = ""
+    for article_id, article in enumerate(articles, 1):
+        articles_text += f"""
+    [기사 {article_id}]
+    제목: {article.get('title', '')}
+    내용: {article.get('content', '')[:SCREENING_BATCH_CONTENT_CHARS]}
+"""
+    
+    screening_prompt = f"""
+    다음 기사들이 각각 팩트체크에 적합한 정치인의 발언을 포함하는지 평가해주세요:
+    {articles_text}
+    {SCREENING_CRITERIA}
+    모든 기사에 대해 기사 번호(id)별로 JSON 형식으로 응답해주세요:
+    {{
+        "results": [
+            {{"id": 1, "has_factcheckable_claim": true/false, "reason": "이유"}}
+        ]
+    }}
+    """
+    
+    screening_result = llm_json_request("screening", screening_prompt, schema="batch_screening")
+    
+    # 기사 번호별 판정 정리
+    verdicts = {}
+    results = screening_result.get("results") if isinstance(screening_result, dict) else None
+    for entry in results if isinstance(results, list) else []:
+        try:
+            article_id = int(entry.get("id"))
+        except (AttributeError, TypeError, ValueError):
+            continue
+        if 1 <= article_id <= len(articles) and isinstance(entry.get("has_factcheckable_claim"), bool):
+            verdicts[article_id] = (entry["has_factcheckable_claim"], entry.get("reason", ""))
+    
+    if len(verdicts) < len(articles):
+        print_progress(f"일괄 스크리닝 응답에서 {len(articles) - len(verdicts)}개 판정 누락, 개별 스크리닝으로 대체")
+    
+    screened = []
+    for article_id, article in enumerate(articles, 1):
+        if article_id not in verdicts:
+            screened.append(screen_article_content(article))
+            continue
+        
+        has_claim, reason = verdicts[article_id]
+        if not has_claim:
+            print_progress(f"기사가 팩트체크에 적합하지 않음: {article.get('title', '')[:30]}... ({reason})")
+        screened.append(has_claim)
+    
+    return screened
+
+# 2단계: 발언자와 발언 추출
+def extract_factcheckable_claim(article):
+    """기사에서 팩트체크에 가장 적합한 인용구를 골라 검증 대상 발언으로 반환"""
     print_progress("팩트체크 가능한 발언 추출 중...")
     
     # 직접 인용구 중심 발언 추출 강화
-    direct_quotes = extract_direct_quotes_with_speakers(content)
+    direct_quotes = extract_direct_quotes_with_speakers(article.get('content', ''))
     
     if not direct_quotes:
         print_progress("직접 인용구를 찾을 수 없음")
@@ -627,24 +1702,32 @@ def three_stage_factcheck(article):
     
     print_progress(f"발언자: {speaker}, 발언: {claim[:50]}...")
     
-    # 3단계: 추가 정보 수집 및 검증
+    return {
+        "speaker": speaker,
+        "statement": claim,
+        "context": selected_quote.get("context", "기사 인용")
+    }
+
+# 3단계: 검증을 위한 추가 정보 수집
+def gather_verification_evidence(claim_info):
+    """발언 검증에 사용할 참고자료 검색"""
     print_progress("검증을 위한 추가 정보 수집 중...")
     
     # 더 효과적인 검색을 위한 다중 검색 엔진 활용
-    additional_info = multi_search_for_verification(speaker, claim)
+    additional_info = multi_search_for_verification(claim_info["speaker"], claim_info["statement"])
     
     if not additional_info:
         print_progress("추가 정보를 찾을 수 없음")
-    else:
-        print_progress(f"{len(additional_info)}개의 관련 정보 찾음")
+        return []
     
-    # 공인 팩트체크 예시와 RAG를 활용한 고급 팩트체크 수행
+    print_progress(f"{len(additional_info)}개의 관련 정보 찾음")
+    return additional_info
+
+# 4단계: 공인 팩트체크 예시와 RAG를 활용한 검증
+def verify_factcheck_claim(claim_info, additional_info):
+    """수집한 참고자료로 발언 검증"""
     print_progress("팩트체크 수행 중...")
-    factcheck_result = verify_claim_with_enhanced_examples({
-        "speaker": speaker,
-        "statement": claim,
-        "context": selected_quote.get("context", "기사 인용")
-    }, additional_info)
+    factcheck_result = verify_claim_with_enhanced_examples(claim_info, additional_info)
     
     if factcheck_result:
         print_progress(f"팩트체크 완료: {factcheck_result.get('verification_result', '')}")
@@ -683,22 +1766,168 @@ def extract_direct_quotes_with_speakers(content):
     - 정책 효과나 결과에 대한 주장
     """
     
-    result = gpt35_json_request(prompt)
+    result = llm_json_request("extraction", prompt, schema="quotes")
     
     if not result or "quotes" not in result:
         return []
         
     return result.get("quotes", [])
 
+# 인용부호 변형과 인용 뒤에 붙는 조사 (발언 정규화 시 제거)
+QUOTE_CHARACTERS = "\"'`“”„‟‘’‚‛「」『』〈〉《》«»″′"
+QUOTE_TRANSLATION = str.maketrans("", "", QUOTE_CHARACTERS)
+CLAIM_TRAILING_PARTICLES = ("이라고", "라고", "이라며", "라며", "이라는", "라는")
+
+# 비교용 발언 정규화
+def normalize_claim_text(text):
+    """유니코드(NFC/전각 문자), 인용부호, 공백, 끝부분 문장부호와 조사를 정규화"""
+    # NFKC: NFC 합성과 함께 전각 문자를 반각으로 변환
+    text = unicodedata.normalize("NFKC", text or "")
+    text = text.translate(QUOTE_TRANSLATION)
+    text = re.sub(r"\s+", " ", text).strip().lower()
+    
+    # 끝부분 문장부호와 인용 조사 반복 제거
+    while True:
+        stripped = text.rstrip(" .,!?…~")
+        for particle in CLAIM_TRAILING_PARTICLES:
+            if stripped.endswith(particle) and len(stripped) > len(particle):
+                stripped = stripped[:-len(particle)].rstrip()
+                break
+        if stripped == text:
+            return text
+        text = stripped
+
+# 검색 캐시 키 생성
+def search_cache_key(speaker, claim):
+    """정규화된 발언자와 발언 전체의 해시"""
+    normalized = normalize_claim_text(speaker) + "\x1f" + normalize_claim_text(claim)
+    return "claim:" + hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+# 문자 n-gram 집합
+def character_ngrams(text, n=3):
+    """공백을 제거한 문자 n-gram 목록"""
+    compact = text.replace(" ", "")
+    if len(compact) <= n:
+        return [compact] if compact else []
+    return [compact[i:i + n] for i in range(len(compact) - n + 1)]
+
+# MinHash 해시 계수 (실행 간에 같은 서명이 나오도록 고정 시드 사용)
+MINHASH_PRIME = (1 << 61) - 1
+MINHASH_RANDOM = random.Random(20240401)
+MINHASH_COEFFICIENTS = [
+    (MINHASH_RANDOM.randrange(1, MINHASH_PRIME), MINHASH_RANDOM.randrange(0, MINHASH_PRIME))
+    for _ in range(32)
+]
+MINHASH_BANDS = 8  # 밴드당 4개 행
+
+# 문자 n-gram MinHash 서명
+def minhash_signature(text):
+    """정규화된 텍스트의 문자 n-gram 집합에 대한 MinHash 서명"""
+    gram_hashes = [
+        int.from_bytes(hashlib.blake2b(gram.encode('utf-8'), digest_size=8).digest(), "big")
+        for gram in set(character_ngrams(text))
+    ]
+    if not gram_hashes:
+        return [0] * len(MINHASH_COEFFICIENTS)
+    return [min((a * h + b) % MINHASH_PRIME for h in gram_hashes) for a, b in MINHASH_COEFFICIENTS]
+
+# 유사 발언 색인 (MinHash LSH)
+class MinHashIndex:
+    """MinHash 서명을 밴드로 나눠 색인하여 n-gram 자카드 유사도가 높은 발언 검색"""
+
+    def __init__(self, path, table):
+        self.table = table
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, scope TEXT NOT NULL, text TEXT NOT NULL)"
+        )
+        self.conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table}_bands (key TEXT NOT NULL, band INTEGER NOT NULL, value TEXT NOT NULL)"
+        )
+        self.conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_bands_value ON {table}_bands (band, value)")
+        self.conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_bands_key ON {table}_bands (key)")
+        self.conn.commit()
+
+    @staticmethod
+    def band_values(text):
+        signature = minhash_signature(text)
+        rows = len(signature) // MINHASH_BANDS
+        return [
+            hashlib.blake2b(repr(signature[band * rows:(band + 1) * rows]).encode(), digest_size=8).hexdigest()
+            for band in range(MINHASH_BANDS)
+        ]
+
+    def add(self, key, scope, text):
+        """정규화된 텍스트를 색인에 추가"""
+        bands = self.band_values(text)
+        with self.lock:
+            self.conn.execute(f"DELETE FROM {self.table}_bands WHERE key = ?", (key,))
+            self.conn.execute(f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?)", (key, scope, text))
+            self.conn.executemany(
+                f"INSERT INTO {self.table}_bands VALUES (?, ?, ?)",
+                [(key, band, value) for band, value in enumerate(bands)]
+            )
+            self.conn.commit()
+
+    def find_similar(self, scope, text, min_similarity):
+        """같은 범위(발언자)에서 자카드 유사도가 가장 높은 텍스트의 키 반환 (없으면 None)"""
+        bands = self.band_values(text)
+        band_filter = " OR ".join(["(b.band = ? AND b.value = ?)"] * len(bands))
+        params = [item for band, value in enumerate(bands) for item in (band, value)]
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT DISTINCT f.key, f.text FROM {self.table}_bands b "
+                f"JOIN {self.table} f ON f.key = b.key WHERE f.scope = ? AND ({band_filter})",
+                (scope, *params)
+            ).fetchall()
+        
+        # 후보는 실제 n-gram 자카드 유사도로 재확인하여 잘못된 공유 방지
+        text_grams = set(character_ngrams(text))
+        best_key, best_similarity = None, min_similarity
+        for key, candidate_text in rows:
+            candidate_grams = set(character_ngrams(candidate_text))
+            union = text_grams | candidate_grams
+            similarity = len(text_grams & candidate_grams) / len(union) if union else 0.0
+            if similarity >= best_similarity:
+                best_key, best_similarity = key, similarity
+        return best_key
+
+    def prune(self, valid_table):
+        """캐시에서 삭제된 키의 색인 정리"""
+        with self.lock:
+            removed = self.conn.execute(
+                f"DELETE FROM {self.table} WHERE key NOT IN (SELECT key FROM {valid_table})"
+            ).rowcount
+            self.conn.execute(
+                f"DELETE FROM {self.table}_bands WHERE key NOT IN (SELECT key FROM {self.table})"
+            )
+            self.conn.commit()
+        return removed
+
 # 다중 검색 엔진을 활용한 정보 수집 (성능 향상)
 def multi_search_for_verification(speaker, claim):
     """여러 검색 엔진과 소스를 활용한 추가 정보 수집"""
     
-    # 캐시 키 생성
-    cache_key = f"{speaker}:{claim[:50]}"
-    if cache_key in search_cache:
+    # 캐시 키 생성 (정규화된 발언 전체 기준)
+    cache_key = search_cache_key(speaker, claim)
+    speaker_scope = normalize_claim_text(speaker)
+    normalized_claim = normalize_claim_text(claim)
+    
+    cached_results = search_cache.get(cache_key) if search_cache is not None else None
+    if cached_results is not None:
         print_progress("캐시된 검색 결과 사용")
-        return search_cache[cache_key]
+        return cached_results
+    
+    # 표현만 조금 다른 같은 발언의 검색 결과 재사용
+    if search_fingerprints is not None:
+        similar_key = search_fingerprints.find_similar(
+            speaker_scope, normalized_claim, SEARCH_NEAR_DUPLICATE_MIN_SIMILARITY
+        )
+        cached_results = search_cache.get(similar_key) if similar_key else None
+        if cached_results is not None:
+            print_progress("유사 발언의 캐시된 검색 결과 사용")
+            return cached_results
     
     # 검색 쿼리 구성
     search_queries = [
@@ -707,53 +1936,110 @@ def multi_search_for_verification(speaker, claim):
         f"{speaker} 발언 팩트체크"  # 발언자와 팩트체크
     ]
     
-    all_results = []
+    # 네이버 검색 API(종류별)가 있으면 API로, 없으면 검색 페이지 스크래핑으로 모든 요청을 동시에 보냄
+    # (구글 검색은 오픈 API가 제한적이지만, 필요하다면 같은 방식으로 추가 가능)
+    if NAVER_CLIENT_ID and NAVER_CLIENT_SECRET:
+        searches = [(search_naver_api, query, search_type) for query in search_queries for search_type in EVIDENCE_SEARCH_TYPES]
+    else:
+        searches = [(search_naver_web, query) for query in search_queries]
     
-    # 각 쿼리로 검색
-    for query in search_queries:
-        try:
-            # 네이버 검색
-            naver_results = search_naver_web(query)
-            relevant_naver = filter_relevant_results(naver_results, claim)
-            all_results.extend(relevant_naver)
-            
-            # 구글 검색은 오픈 API가 제한적이지만, 필요하다면 구현 가능
-            # google_results = search_google(query)
-            # all_results.extend(google_results)
-            
-            # 충분한 정보를 얻었으면 중단
-            if len(all_results) >= 5:
-                break
-                
-        except Exception as e:
-            print_progress(f"검색 오류: {e}")
+    # API 결과는 모든 요청(동시에 보내므로 왕복 한 번)을 기다려 합친 뒤 한 번에 순위를 매기고,
+    # 스크래핑 결과는 도착하는 순서대로 관련 결과가 5개 모이면 남은 스크래핑을 기다리지 않음
+    api_results = []
+    scraped_results = []
+    scraped_urls = set()
+    failed_searches = Counter()
     
-    # 결과 중복 제거 및 최대 개수 제한
-    unique_results = []
-    urls = set()
+    def collecting():
+        return len(scraped_results) < 5 or any(search[0] is search_naver_api for search in pending.values())
     
-    for result in all_results:
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(searches), thread_name_prefix="evidence-search")
+    try:
+        pending = {executor.submit(*search): search for search in searches}
+        
+        while pending and collecting():
+            done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                backend, query = pending.pop(future)[:2]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    print_progress(f"검색 오류: {e}")
+                    
+                    # 모든 종류의 API 요청이 실패한 쿼리는 검색 페이지 스크래핑으로 대체
+                    if backend is search_naver_api:
+                        failed_searches[query] += 1
+                        if failed_searches[query] == len(EVIDENCE_SEARCH_TYPES):
+                            pending[executor.submit(search_naver_web, query)] = (search_naver_web, query)
+                    continue
+                
+                if backend is search_naver_api:
+                    api_results.extend(results)
+                    continue
+                
+                for result in filter_relevant_results(results, claim):
+                    url = result.get('url', '')
+                    if url and url not in scraped_urls and len(scraped_results) < 5:
+                        scraped_urls.add(url)
+                        scraped_results.append(result)
+    finally:
+        # 충분한 정보를 얻었으면 남은 스크래핑은 기다리지 않음
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    # 모든 요청의 결과를 URL 기준으로 중복 제거하여 함께 순위 매기고 전체 토큰 예산에 맞춤
+    combined_results = {}
+    for result in api_results + scraped_results:
         url = result.get('url', '')
-        if url and url not in urls:
-            urls.add(url)
-            unique_results.append(result)
-            
-            # 최대 5개까지만 사용
-            if len(unique_results) >= 5:
-                break
+        if url and url not in combined_results:
+            combined_results[url] = result
+    unique_results = rank_evidence(list(combined_results.values()), claim)
     
     # 캐시에 저장
-    search_cache[cache_key] = unique_results
+    if search_cache is not None:
+        search_cache.set(cache_key, unique_results)
+        if search_fingerprints is not None:
+            search_fingerprints.add(cache_key, speaker_scope, normalized_claim)
     
     return unique_results
 
-# 네이버 웹 검색 (더 많은 정보 수집)
+# 네이버 검색 API 결과 항목의 HTML 태그와 엔티티 제거
+def clean_naver_api_text(text):
+    """검색어 강조 태그(<b>)와 HTML 엔티티를 제거한 텍스트"""
+    return html.unescape(re.sub('<[^<]+?>', '', text or '')).strip()
+
+# 네이버 검색 API로 근거 검색 (공유 세션 + 속도 제한)
+def search_naver_api(query, search_type):
+    """네이버 검색 API(news/webkr/blog)에서 관련도순 결과를 한 번에 최대 EVIDENCE_SEARCH_DISPLAY개 가져옴"""
+    headers = {
+        "X-Naver-Client-Id": NAVER_CLIENT_ID,
+        "X-Naver-Client-Secret": NAVER_CLIENT_SECRET
+    }
+    
+    naver_rate_limiter.acquire()
+    response = http_session.get(
+        NAVER_SEARCH_API_URL.format(search_type),
+        headers=headers,
+        params={"query": query, "display": EVIDENCE_SEARCH_DISPLAY, "sort": "sim"},
+        timeout=5
+    )
+    response.raise_for_status()
+    
+    search_results = []
+    for item in response.json().get("items", []):
+        url = item.get("originallink") or item.get("link")
+        if url:
+            search_results.append({
+                "title": clean_naver_api_text(item.get("title")),
+                "description": clean_naver_api_text(item.get("description")),
+                "url": url
+            })
+    return search_results
+
+# 네이버 웹 검색 (검색 API를 쓸 수 없을 때의 대체 수단)
 def search_naver_web(query):
     """네이버 웹 검색으로 정보 수집"""
     
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    }
+    headers = {"User-Agent": USER_AGENT}
     
     # 검색 쿼리 인코딩
     encoded_query = requests.utils.quote(query)
@@ -762,8 +2048,8 @@ def search_naver_web(query):
     search_url = f"https://search.naver.com/search.naver?query={encoded_query}"
     
     try:
-        response = requests.get(search_url, headers=headers, timeout=5)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        response = http_session.get(search_url, headers=headers, timeout=5)
+        soup = BeautifulSoup(response.text, HTML_PARSER)
         
         # 검색 결과 추출
         search_results = []
@@ -804,34 +2090,142 @@ def search_naver_web(query):
         print_progress(f"네이버 웹 검색 오류: {e}")
         return []
 
+# BM25 점수 계산 (문자 bigram 기준 - 조사가 붙은 한국어 어절도 부분 일치)
+def bm25_scores(query, documents, k1=1.5, b=0.75):
+    """documents 각각의 query 대비 BM25 점수 목록"""
+    query_terms = Counter(character_ngrams(query.lower(), n=2))
+    document_terms = [Counter(character_ngrams(document.lower(), n=2)) for document in documents]
+    if not documents or not query_terms:
+        return [0.0] * len(documents)
+    
+    average_length = sum(sum(terms.values()) for terms in document_terms) / len(documents) or 1
+    document_frequency = Counter(term for terms in document_terms for term in terms if term in query_terms)
+    
+    scores = []
+    for terms in document_terms:
+        length = sum(terms.values())
+        score = 0.0
+        for term in query_terms:
+            frequency = terms.get(term, 0)
+            if frequency:
+                idf = math.log(1 + (len(documents) - document_frequency[term] + 0.5) / (document_frequency[term] + 0.5))
+                score += idf * frequency * (k1 + 1) / (frequency + k1 * (1 - b + b * length / average_length))
+        scores.append(score)
+    return scores
+
+# 근거 자료 순위 매기기
+def rank_evidence(search_results, statement, top_k=EVIDENCE_TOP_K, token_budget=EVIDENCE_TOKEN_BUDGET):
+    """발언과의 BM25 점수 순으로 최고 점수 대비 기준 이상인 결과를 top_k개, 토큰 예산 안에서 선택"""
+    scores = bm25_scores(statement, [f"{result.get('title', '')} {result.get('description', '')}" for result in search_results])
+    if not scores or max(scores) <= 0:
+        return []
+    
+    minimum_score = max(scores) * EVIDENCE_MIN_RELATIVE_SCORE
+    ranked = sorted(zip(scores, range(len(search_results))), key=lambda pair: (-pair[0], pair[1]))
+    
+    selected = []
+    used_tokens = 0
+    for score, index in ranked:
+        if score < minimum_score or len(selected) >= top_k:
+            break
+        
+        # 검증 프롬프트에 들어가는 형태 기준으로 토큰 수 계산
+        result = search_results[index]
+        tokens = count_tokens(f"{result.get('title', '')}\n{result.get('description', '')}\n{result.get('url', '')}")
+        if used_tokens + tokens > token_budget:
+            continue
+        used_tokens += tokens
+        selected.append(result)
+    return selected
+
+# 발언과 비슷한 팩트체크 예시 선택
+def select_factcheck_examples(text, max_examples=FACTCHECK_EXAMPLE_COUNT, token_budget=FACTCHECK_EXAMPLE_TOKEN_BUDGET, exclude=()):
+    """BM25 유사도순으로 예시를 고르되 같은 분야는 한 번씩만 먼저 사용하고, 토큰 예산 안에서 최대 max_examples개 반환"""
+    scores = bm25_scores(text, [f"{record['claim']} {record['explanation']}" for record in FACTCHECK_EXAMPLE_RECORDS])
+    ranked = sorted(
+        (index for index, record in enumerate(FACTCHECK_EXAMPLE_RECORDS) if record not in exclude),
+        key=lambda index: (-scores[index], index)
+    )
+    
+    # 분야가 겹치지 않는 예시를 먼저, 그다음 나머지를 유사도순으로
+    seen_categories = set()
+    diverse, remaining = [], []
+    for index in ranked:
+        category = FACTCHECK_EXAMPLE_RECORDS[index]["category"]
+        (remaining if category in seen_categories else diverse).append(index)
+        seen_categories.add(category)
+    
+    selected = []
+    used_tokens = 0
+    for index in diverse + remaining:
+        record = FACTCHECK_EXAMPLE_RECORDS[index]
+        if len(selected) >= max_examples:
+            break
+        if used_tokens + record["tokens"] > token_budget and selected:
+            continue
+        used_tokens += record["tokens"]
+        selected.append(record)
+    
+    return "\n\n".join(record["text"] for record in selected)
+
 # 관련 있는 검색 결과만 필터링
 def filter_relevant_results(search_results, statement):
-    """발언과 관련 있는 검색 결과만 필터링"""
+    """발언과 관련 있는 검색 결과만 관련도순으로 필터링"""
     
     # 검색 결과가 없으면 빈 리스트 반환
     if not search_results:
         return []
     
-    # 관련성 판단을 위한 핵심 키워드 추출
-    statement_words = set(re.findall(r'\w+', statement.lower()))
-    
-    relevant_results = []
-    for result in search_results:
-        title = result.get('title', '')
-        description = result.get('description', '')
-        
-        # 제목과 설명에서 키워드 추출
-        result_words = set(re.findall(r'\w+', (title + ' ' + description).lower()))
-        
-        # 키워드 겹침 정도 계산
-        common_words = statement_words.intersection(result_words)
-        
-        # 최소 2개 이상의 키워드가 겹치면 관련 있는 것으로 판단
-        if len(common_words) >= 2:
-            relevant_results.append(result)
+    return rank_evidence(search_results, statement)
+
+# 검증 프롬프트의 고정 부분 (시스템 메시지)
+# 역할, 가이드라인, 고정 예시, 응답 형식을 모든 검증 요청에서 똑같이 앞에 두어
+# API 서버의 프롬프트 접두사 캐시(1024토큰 이상)에 적중하도록 하고, 발언별 내용은 사용자 메시지로만 전달
+VERIFICATION_SYSTEM_PROMPT = f"""당신은 공정하고 객관적인 팩트체크 전문가입니다. 공인 팩트체크 기관의 방식을 따라 철저한 근거에 기반한 팩트체크를 수행합니다.
+
+아래의 공인 팩트체크 기관들의 예시를 참고하여 어떻게 팩트체크를 수행해야 하는지 이해해주세요:
+
+{chr(10).join(record["text"] + chr(10) for record in STATIC_FACTCHECK_EXAMPLES)}
+▶ 팩트체크 가이드라인:
+1. 반드시 위 예시들처럼 구체적인 출처와 통계를 활용하세요
+2. 예시처럼 "판정"과 "근거"를 명확히 구분하여 제시하세요
+3. 모든 주장은 검증 가능한 객관적 사실에 기반해야 합니다
+4. 정확한 통계, 법률, 공식 문서 등을 인용하세요
+5. 불확실한 정보가 있다면 "확인 불가" 판정을 내리되, 왜 확인할 수 없는지 설명하세요
+
+▶ 판정은 다음 중 하나를 사용하세요:
+- 사실: 주장이 완전히 사실과 일치
+- 대체로 사실: 주장이 대체로 사실이나 일부 과장/누락 있음
+- 일부 사실: 주장의 일부만 사실이고 나머지는 사실과 다름
+- 사실 아님: 주장이 사실과 다름
+- 확인 불가: 현재 정보로는 사실 여부를 확인할 수 없음
+
+다음 JSON 형식으로, 판정 결과부터 이 순서대로 응답해주세요 (발언자, 주장, 맥락은 다시 적지 마세요):
+{{
+    "verification_result": "판정 결과",
+    "explanation": "상세한 판정 근거와 출처",
+    "sources": ["출처1", "출처2"],
+    "speaker_position": "발언자의 직위",
+    "party": "소속 정당"
+}}
+"""
+
+# 검증 응답을 스트리밍으로 받으며 품질 기준 미달이 확정되면 조기 중단할지 여부
+STREAM_VERIFICATION = os.getenv("STREAM_VERIFICATION", "true").lower() == "true"
+
+# 스트리밍 검증 응답의 조기 중단 판단
+def verification_abort_reason(partial):
+    """받은 부분만으로 품질 기준을 더는 넘을 수 없으면 그 이유 반환 (아직 모르면 None)"""
+    if "explanation" not in partial.completed:
+        return None
     
-    # 최대 5개까지 제한
-    return relevant_results[:5]
+    verdict = partial.values.get("verification_result") if "verification_result" in partial.completed else None
+    # 출처 목록이 아직 오지 않았다면 URL 출처가 올 것으로 보고 최대 점수 계산
+    sources = partial.values["sources"] if "sources" in partial.completed else ["http://"]
+    best_score = factcheck_quality_score(verdict, partial.values["explanation"], sources)
+    if best_score < QUALITY_MINIMUM_SCORE:
+        return f"품질 점수 최대 {best_score}점 (기준 {QUALITY_MINIMUM_SCORE}점)"
+    return None
 
 # 공인 팩트체크 예시 및 RAG를 활용한 팩트체크
 def verify_claim_with_enhanced_examples(claim_info, additional_info):
@@ -854,82 +2248,49 @@ def verify_claim_with_enhanced_examples(claim_info, additional_info):
     else:
         print_progress(f"{len(additional_info)}개의 정보 소스로 검증 시작")
     
-    # 강화된 프롬프트 - 공인 팩트체크 예시 포함
+    # 고정 예시 외에 발언과 가장 비슷한 예시 하나는 가변 부분에 추가
+    related_example = select_factcheck_examples(f"{statement} {context}", max_examples=1, exclude=STATIC_FACTCHECK_EXAMPLES)
+    
+    # 가변 부분 - 발언별 내용만 포함
     prompt = f"""다음 정치인의 발언을 객관적으로 팩트체크해주세요.
 
 발언자: {speaker}
 주장: "{statement}"
 발언 맥락: {context}
 
-먼저 아래의 공인 팩트체크 기관들의 예시를 참고하여 어떻게 팩트체크를 수행해야 하는지 이해해주세요:
+이 발언과 비슷한 팩트체크 예시:
 
-{FACTCHECK_EXAMPLES}
-
-이제 위 예시들을 참고하여 아래 정보를 바탕으로 발언을 팩트체크해주세요:
-
-{additional_info_text}
-
-▶ 팩트체크 가이드라인:
-1. 반드시 위 예시들처럼 구체적인 출처와 통계를 활용하세요
-2. 예시처럼 "판정"과 "근거"를 명확히 구분하여 제시하세요
-3. 모든 주장은 검증 가능한 객관적 사실에 기반해야 합니다
-4. 정확한 통계, 법률, 공식 문서 등을 인용하세요
-5. 불확실한 정보가 있다면 "확인 불가" 판정을 내리되, 왜 확인할 수 없는지 설명하세요
+{related_example}
 
-▶ 판정은 다음 중 하나를 사용하세요:
-- 사실: 주장이 완전히 사실과 일치
-- 대체로 사실: 주장이 대체로 사실이나 일부 과장/누락 있음
-- 일부 사실: 주장의 일부만 사실이고 나머지는 사실과 다름
-- 사실 아님: 주장이 사실과 다름
-- 확인 불가: 현재 정보로는 사실 여부를 확인할 수 없음
+위 예시들을 참고하여 아래 정보를 바탕으로 발언을 팩트체크해주세요:
 
-다음 JSON 형식으로 응답해주세요:
-{{
-    "speaker": "{speaker}",
-    "speaker_position": "발언자의 직위",
-    "party": "소속 정당",
-    "statement": "{statement}",
-    "context": "{context}",
-    "verification_result": "판정 결과",
-    "explanation": "상세한 판정 근거와 출처",
-    "sources": ["출처1", "출처2"]
-}}
-"""
+{additional_info_text}"""
     
     try:
-        # GPT-4 사용 (팩트체크 정확도를 위해)
-        print_progress("GPT-4에 검증 요청 보내는 중...")
-        response = client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": "당신은 공정하고 객관적인 팩트체크 전문가입니다. 공인 팩트체크 기관의 방식을 따라 철저한 근거에 기반한 팩트체크를 수행합니다."},
-                {"role": "user", "content": prompt}
-            ],
+        # 저렴한 모델부터 시도하고 품질 기준에 못 미치면 상위 모델로 승급
+        print_progress("검증 요청 보내는 중...")
+        response_text, result = routed_json_completion(
+            "verification",
+            VERIFICATION_SYSTEM_PROMPT,
+            prompt,
             temperature=0.1,
-            max_tokens=1200  # 충분한 설명을 위해 토큰 증가
+            max_tokens=1200,  # 충분한 설명을 위해 토큰 증가
+            schema="verdict",
+            abort_check=verification_abort_reason if STREAM_VERIFICATION else None,
+            accept=meets_quality_bar
         )
+        print_progress(f"검증 응답 받음: {len(response_text)}자")
         
-        response_text = response.choices[0].message.content.strip()
-        print_progress(f"GPT-4 응답 받음: {len(response_text)}자")
-        
-        # JSON 추출
-        json_match = re.search(r'(\{.*\})', response_text, re.DOTALL)
-        if json_match:
-            try:
-                result = json.loads(json_match.group(1))
-                
-                # 날짜 추가
-                result["date"] = datetime.datetime.now().strftime("%Y.%m.%d")
-                if "context" not in result:
-                    result["context"] = context
-                    
-                return result
-            except json.JSONDecodeError:
-                print_progress(f"JSON 파싱 오류: {response_text[:100]}...")
-                return None
-        else:
-            print_progress(f"JSON 응답 없음: {response_text[:100]}...")
+        if result is None:
             return None
+        
+        # 날짜 추가 및 발언 정보 보완
+        result["date"] = datetime.datetime.now().strftime("%Y.%m.%d")
+        for field, value in (("speaker", speaker), ("statement", statement), ("context", context)):
+            if not result.get(field):
+                result[field] = value
+            
+        return result
             
     except Exception as e:
         print_progress(f"검증 오류: {e}")
@@ -938,7 +2299,7 @@ def verify_claim_with_enhanced_examples(claim_info, additional_info):
 
 # Fallback: 기사 전체를 GPT에 전달하여 직접 팩트체크
 def fallback_direct_factcheck(article):
-    """백업 전략: GPT-4에 기사 전체를 전달하여 직접 팩트체크"""
+    """백업 전략: LLM에 기사 전체를 전달하여 직접 팩트체크"""
     print_progress("대체 팩트체크 접근법 사용 중...")
     
     title = article.get('title', '')
@@ -956,9 +2317,11 @@ def fallback_direct_factcheck(article):
         except Exception as e:
             print_progress(f"전체 내용 가져오기 오류: {e}")
     
-    # 토큰 제한을 위해 내용 요약
-    if len(content) > 2000:
-        content = content[:2000] + "..."
+    # 토큰 예산에 맞게 내용 자르기
+    content = truncate_to_tokens(content, FALLBACK_ARTICLE_TOKEN_BUDGET)
+    
+    # 기사와 비슷한 공인 팩트체크 예시만 선택 (예시 중간에서 잘리지 않도록 사례 단위로)
+    examples_text = select_factcheck_examples(f"{title} {content}")
     
     prompt = f"""이 기사를 바탕으로 가능한 가장 정확한 팩트체크를 수행해주세요:
 
@@ -968,7 +2331,7 @@ def fallback_direct_factcheck(article):
 
 다음 공인 팩트체크 기관의 예시를 참고하여:
 
-{FACTCHECK_EXAMPLES[:1000]}  # 예시의 앞부분만 사용
+{examples_text}
 
 다음 작업을 수행해주세요:
 1. 기사에서 정치인의 주요 사실 주장을 식별하세요.
@@ -990,66 +2353,47 @@ def fallback_direct_factcheck(article):
     
     try:
         print_progress("대체 검증 요청 보내는 중...")
-        response = client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "system", "content": "당신은 최고의 팩트체크 전문가입니다. 기사에서 검증 가능한 주장을 식별하고 이를 객관적으로 검증하세요."},
-                {"role": "user", "content": prompt}
-            ],
+        response_text, result = routed_json_completion(
+            "fallback",
+            "당신은 최고의 팩트체크 전문가입니다. 기사에서 검증 가능한 주장을 식별하고 이를 객관적으로 검증하세요.",
+            prompt,
             temperature=0.1,
-            max_tokens=1000
+            max_tokens=1000,
+            schema="verdict",
+            accept=meets_quality_bar
         )
-        
-        response_text = response.choices[0].message.content.strip()
         print_progress(f"대체 검증 응답 받음: {len(response_text)}자")
         
-        # JSON 추출
-        json_match = re.search(r'(\{.*\})', response_text, re.DOTALL)
-        if json_match:
-            try:
-                result = json.loads(json_match.group(1))
-                
-                # 날짜 추가
-                result["date"] = datetime.datetime.now().strftime("%Y.%m.%d")
-                
-                return result
-            except json.JSONDecodeError:
-                print_progress(f"JSON 파싱 오류: {response_text[:100]}...")
-                return None
-        else:
-            print_progress(f"JSON 응답 없음: {response_text[:100]}...")
+        if result is None:
             return None
+        
+        # 날짜 추가
+        result["date"] = datetime.datetime.now().strftime("%Y.%m.%d")
+        
+        return result
             
     except Exception as e:
         print_progress(f"대체 검증 오류: {e}")
         traceback.print_exc()
         return None
 
-# 강화된 팩트체크 결과 품질 검증
-def validate_factcheck_quality(factcheck_result):
-    """강화된 팩트체크 결과 품질 검증"""
-    
-    # 기본 필드 확인
-    required_fields = ["speaker", "statement", "verification_result", "explanation"]
-    if not all(field in factcheck_result for field in required_fields):
-        print_progress("필수 필드 누락")
-        return False
-    
-    # 근거 및 출처 확인
-    explanation = factcheck_result.get("explanation", "")
-    
+# 최소 품질 점수
+QUALITY_MINIMUM_SCORE = 2 if FORCE_UPDATE else 3
+
+# 품질 점수에 반영하는 기관명
+OFFICIAL_SOURCES = ["통계청", "한국은행", "보건복지부", "기획재정부", "행정안전부", "법원", "국회"]
+
+# 팩트체크 결과 품질 점수
+def factcheck_quality_score(verdict, explanation, sources):
+    """출처 URL, 통계 수치, 기관명 언급으로 점수를 매기고 이유 없는 확인 불가 판정은 감점"""
     # 출처 URL 포함 여부
-    has_urls = bool(re.search(r'https?://\S+', explanation)) or (
-        "sources" in factcheck_result and 
-        any(source.startswith('http') for source in factcheck_result.get("sources", []))
-    )
+    has_urls = bool(re.search(r'https?://\S+', explanation)) or any(isinstance(source, str) and source.startswith('http') for source in sources)
     
     # 통계 수치 포함 여부
     has_statistics = bool(re.search(r'\d+(?:\.\d+)?%|\d+(?:\.\d+)?배|\d+(?:조|억|만)?\s*원', explanation))
     
     # 기관명 언급 여부
-    official_sources = ["통계청", "한국은행", "보건복지부", "기획재정부", "행정안전부", "법원", "국회"]
-    has_official_source = any(source in explanation for source in official_sources)
+    has_official_source = any(source in explanation for source in OFFICIAL_SOURCES)
     
     # 점수 산정
     quality_score = 0
@@ -1058,145 +2402,696 @@ def validate_factcheck_quality(factcheck_result):
     if has_official_source: quality_score += 1
     
     # 검증 불가 판정 시 명확한 이유 확인
-    if factcheck_result.get("verification_result") == "확인 불가":
-        has_clear_reason = "확인할 수 없는 이유" in explanation or "검증이 불가능한 이유" in explanation
-        if not has_clear_reason:
-            print_progress("확인 불가 판정에 대한 명확한 이유 누락")
-            quality_score -= 1
+    if verdict == "확인 불가" and not has_clear_unverifiable_reason(explanation):
+        quality_score -= 1
+    
+    return quality_score
+
+# 확인 불가 판정의 이유 설명 여부
+def has_clear_unverifiable_reason(explanation):
+    """설명에 확인할 수 없는 이유를 밝혔는지 여부"""
+    return "확인할 수 없는 이유" in explanation or "검증이 불가능한 이유" in explanation
+
+# 품질 기준 충족 여부 (모델 승급 판단용)
+def meets_quality_bar(factcheck_result):
+    """validate_factcheck_quality와 같은 점수 기준을 로그 없이 적용"""
+    return factcheck_quality_score(
+        factcheck_result.get("verification_result"),
+        factcheck_result.get("explanation") or "",
+        factcheck_result.get("sources") or []
+    ) >= QUALITY_MINIMUM_SCORE
+
+# 강화된 팩트체크 결과 품질 검증
+def validate_factcheck_quality(factcheck_result):
+    """강화된 팩트체크 결과 품질 검증"""
+    
+    # 기본 필드 확인
+    required_fields = ["speaker", "statement", "verification_result", "explanation"]
+    if not all(field in factcheck_result for field in required_fields):
+        print_progress("필수 필드 누락")
+        return False
     
-    # 최소 품질 기준
-    minimum_score = 2 if FORCE_UPDATE else 3
+    verdict = factcheck_result.get("verification_result")
+    explanation = factcheck_result.get("explanation", "")
+    if verdict == "확인 불가" and not has_clear_unverifiable_reason(explanation):
+        print_progress("확인 불가 판정에 대한 명확한 이유 누락")
+    
+    quality_score = factcheck_quality_score(verdict, explanation, factcheck_result.get("sources", []))
     
-    if quality_score >= minimum_score:
+    if quality_score >= QUALITY_MINIMUM_SCORE:
         print_progress(f"품질 검증 통과: 점수 {quality_score}")
         return True
     else:
         print_progress(f"품질 검증 실패: 점수 {quality_score}")
         return False
 
-# 팩트체크 카드 HTML 생성
-def generate_fact_check_card_html(fact_check):
-    """팩트체크 결과를 HTML 카드로 변환"""
-    
-    party_class = ""
-    avatar_class = ""
-    
-    # 정당에 따른 스타일 클래스 설정
-    if fact_check["party"] == "더불어민주당":
-        party_class = "democrat-indicator"
-        avatar_class = "democrat-avatar"
-    elif fact_check["party"] == "국민의힘":
-        party_class = "ppp-indicator"
-        avatar_class = "ppp-avatar"
-    elif fact_check["party"] == "개혁신당":
-        party_class = "reform-indicator"
-        avatar_class = "reform-avatar"
-    elif fact_check["party"] == "조국혁신당":
-        party_class = "choi-indicator"
-        avatar_class = "choi-avatar"
-    elif fact_check["party"] == "정의당":
-        party_class = "reform-indicator"
-        avatar_class = "reform-avatar"
-    else:
-        party_class = "ppp-indicator"
-        avatar_class = "ppp-avatar"
-    
-    # 정치인 이름의 첫 글자 추출
-    first_letter = fact_check["speaker"][0] if fact_check["speaker"] else "?"
-    
-    # 검증 결과에 따른 스타일 적용
-    verification_result = fact_check.get("verification_result", "확인 불가")
-    result_class = ""
-    
-    if verification_result == "사실":
-        result_class = "result-true"
-    elif verification_result == "대체로 사실":
-        result_class = "result-mostly-true"
-    elif verification_result == "일부 사실":
-        result_class = "result-partially-true"
-    elif verification_result == "사실 아님":
-        result_class = "result-false"
+# 스크리닝 대상 텍스트 (일괄 스크리닝에 보내는 범위와 동일)
+def screening_text(article):
+    """제목과 내용 앞부분을 합친 스크리닝용 텍스트"""
+    return f"{article.get('title', '')} {article.get('content', '')[:SCREENING_BATCH_CONTENT_CHARS]}".strip()
+
+# 스크리닝 결과 기록
+def append_screening_history(texts, verdicts):
+    """GPT 스크리닝 판정을 분류기 학습용 기록 파일에 추가하고 최근 기록만 남김
+
+    응답 실패로 판정이 없는 기사(None)는 부정 판정으로 학습되지 않도록 기록하지 않는다.
+    """
+    try:
+        checked_at = datetime.datetime.now().isoformat(timespec="seconds")
+        with open(SCREENING_HISTORY_FILE, 'a', encoding='utf-8') as f:
+            for text, has_claim in zip(texts, verdicts):
+                if isinstance(has_claim, bool):
+                    record = {"text": text, "label": has_claim, "checked_at": checked_at}
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        
+        # 매일 커밋되는 파일이 끝없이 커지지 않도록 오래된 기록 정리
+        with open(SCREENING_HISTORY_FILE, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+        if len(lines) > SCREENING_HISTORY_MAX_RECORDS:
+            with open(SCREENING_HISTORY_FILE, 'w', encoding='utf-8') as f:
+                f.writelines(lines[-SCREENING_HISTORY_MAX_RECORDS:])
+    except Exception as e:
+        print_progress(f"스크리닝 기록 저장 오류: {e}")
+
+# 로컬 사전 스크리닝 분류기 - 문자 n-gram 나이브 베이즈
+class ScreeningClassifier:
+    """과거 GPT 스크리닝 판정으로 학습한 문자 3-gram 다항 나이브 베이즈 분류기
+
+    문서 길이에 따라 확률이 극단으로 쏠리지 않도록 n-gram별 로그 우도비의 평균을 사용한다.
+    """
+    
+    def __init__(self, samples):
+        counts = {True: Counter(), False: Counter()}
+        documents = {True: 0, False: 0}
+        for text, label in samples:
+            counts[label].update(character_ngrams(text))
+            documents[label] += 1
+        
+        self.documents = documents
+        vocabulary = set(counts[True]) | set(counts[False])
+        totals = {label: sum(counts[label].values()) + len(vocabulary) for label in counts}
+        
+        # n-gram별 로그 우도비 (라플라스 평활화)
+        self.weights = {
+            ngram: math.log((counts[True][ngram] + 1) / totals[True]) - math.log((counts[False][ngram] + 1) / totals[False])
+            for ngram in vocabulary
+        }
+        self.prior = math.log((documents[True] + 1) / (documents[False] + 1))
+    
+    # 기록 파일에서 학습
+    @classmethod
+    def from_history(cls, path=SCREENING_HISTORY_FILE):
+        """최근 스크리닝 기록으로 학습 (같은 텍스트는 마지막 판정만 사용)"""
+        if not os.path.exists(path):
+            return cls([])
+        
+        latest = {}
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    latest.pop(record["text"], None)
+                    latest[record["text"]] = record["label"]
+        
+        samples = list(latest.items())[-SCREENING_HISTORY_MAX_RECORDS:]
+        return cls(samples)
+    
+    # 학습 기록이 충분한지 확인
+    def is_ready(self):
+        """두 클래스 모두 최소 기록 수를 넘었는지 여부"""
+        return min(self.documents.values()) >= SCREENING_CLASSIFIER_MIN_SAMPLES
+    
+    # 통과 확률 계산
+    def score(self, article):
+        """기사가 GPT 스크리닝을 통과할 확률 추정"""
+        ngrams = character_ngrams(screening_text(article))
+        known = [self.weights[ngram] for ngram in ngrams if ngram in self.weights]
+        evidence = sum(known) / len(known) if known else 0.0
+        logit = max(-30.0, min(30.0, self.prior + evidence * len(ngrams) ** 0.5))
+        return 1 / (1 + math.exp(-logit))
+
+# 로컬 분류기로 GPT 스크리닝 대상 선별
+def gate_articles_for_screening(articles, limit=MAX_ARTICLES_TO_PROCESS):
+    """분류기 통과 확률이 기준 이상인 기사만 최대 limit개 생성 (학습 기록이 부족하면 모두 통과)
+
+    수집이 끝날 때까지 통과한 기사가 SCREENING_CLASSIFIER_MIN_CANDIDATES개보다 적으면 탈락한 기사를
+    점수가 높은 순으로 보충한다. 엄격한 분류기가 모든 기사를 막지 않고, 분류기가 잘못 탈락시킨 기사도
+    GPT 판정을 받아 학습 기록에 반영되도록 하기 위함이다.
+    """
+    classifier = ScreeningClassifier.from_history()
+    if not classifier.is_ready():
+        print_progress(f"스크리닝 기록 부족 (통과 {classifier.documents[True]}개 / 탈락 {classifier.documents[False]}개), 사전 스크리닝 생략")
+    
+    passed = 0
+    skipped = 0
+    rejected = []
+    for article in articles:
+        score = classifier.score(article) if classifier.is_ready() else 1.0
+        if score < SCREENING_CLASSIFIER_THRESHOLD:
+            skipped += 1
+            rejected.append((score, len(rejected), article))
+            continue
+        
+        passed += 1
+        yield article
+        if passed >= limit:
+            break
     else:
-        result_class = "result-unverifiable"
-    
-    # 정치인 직위 표시 추가
-    speaker_position = fact_check.get("speaker_position", "")
-    politician_display = f'{fact_check["speaker"]} {speaker_position}'.strip()
-    
-    # HTML 카드 생성
-    card_html = "<!-- 팩트체크 카드 -->\n"
-    card_html += f'<div class="falsehood-card" data-party="{fact_check["party"]}">\n'
-    card_html += '<div class="falsehood-header">\n'
-    card_html += f'<div class="politician-avatar {avatar_class}">{first_letter}</div>\n'
-    card_html += '<div class="politician-info">\n'
-    card_html += '<div class="politician-name">\n'
-    card_html += f'<span class="party-indicator {party_class}"></span>\n'
-    card_html += f'{politician_display}\n'
-    card_html += '</div>\n'
-    card_html += f'<div class="party-name-small">{fact_check["party"]}</div>\n'
-    card_html += '</div>\n'
-    card_html += f'<div class="falsehood-date">{fact_check["date"]}</div>\n'
-    card_html += '</div>\n'
-    
-    # 발언 출처 표시
-    card_html += '<div class="falsehood-source">\n'
-    card_html += f'<i class="fas fa-bullhorn"></i> {fact_check["context"]}\n'
-    card_html += '</div>\n'
-    
-    # 검증 결과 표시
-    card_html += f'<div class="verification-result {result_class}">\n'
-    card_html += f'<span class="result-label">검증 결과:</span> {verification_result}\n'
-    card_html += '</div>\n'
-    
-    # 발언 내용 표시
-    card_html += '<div class="falsehood-content">\n'
-    card_html += f'{fact_check["statement"]}\n'
-    card_html += '</div>\n'
-    
-    # 검증 설명 표시
-    card_html += '<div class="falsehood-correction">\n'
-    card_html += '<span class="correction-label">검증 설명:</span>\n'
-    card_html += f'{fact_check["explanation"]}\n'
-    card_html += '</div>\n'
-    
-    # 출처 표시
-    if "sources" in fact_check and fact_check["sources"]:
-        card_html += '<div class="falsehood-sources">\n'
-        card_html += '<span class="sources-label">참고 출처:</span>\n'
-        card_html += '<ul>\n'
-        for source in fact_check["sources"]:
-            if source and (source.startswith("http") or source.startswith("www")):
-                card_html += f'<li><a href="{source}" target="_blank">{source}</a></li>\n'
-            else:
-                card_html += f'<li>{source}</li>\n'
-        card_html += '</ul>\n'
-        card_html += '</div>\n'
+        # 통과 기사가 최소 수에 못 미치면 탈락 기사 중 점수가 높은 기사로 보충
+        shortfall = max(min(SCREENING_CLASSIFIER_MIN_CANDIDATES, limit) - passed, 0)
+        for _, _, article in sorted(rejected, key=lambda item: (-item[0], item[1]))[:shortfall]:
+            print_progress(f"최소 스크리닝 수 보충: {article.get('title', '')[:30]}...")
+            skipped -= 1
+            passed += 1
+            yield article
+    
+    print_progress(f"사전 스크리닝: {passed}개 통과, {skipped}개 제외 (기준 {SCREENING_CLASSIFIER_THRESHOLD})")
+
+# 파이프라인 팩트체크 실행 - 단계별 작업자 풀로 여러 기사를 동시에 처리
+def run_factcheck_pipeline(articles, accept_result, max_results=1, deadline=None, force_fallback=False):
+    """기사를 내용 보강 → 일괄 스크리닝 → 발언 추출 → 근거 검색 → 검증 단계로 흘려보내며 병렬 팩트체크
+
+    articles는 제너레이터 등 임의의 반복 가능 객체로, 별도 스레드에서 하나씩 꺼내는 즉시 파이프라인에 넣는다.
+    accept_result(article, result)가 True를 반환한 결과가 max_results개에 도달하거나
+    deadline을 넘기면 수집을 멈추고 대기 중인 작업을 취소하며 진행 중인 작업은 다음 단계로 넘기지 않는다.
+    """
+    if deadline is None:
+        deadline = start_time + MAX_RUNTIME_SECONDS * 0.8
+    
+    stop_event = threading.Event()
+    events = queue.Queue()
+    executors = {
+        stage: concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"pipeline-{stage}")
+        for stage, workers in PIPELINE_STAGE_WORKERS.items()
+    }
+    cancelled = object()
     
-    card_html += '</div>\n'
+    accepted = []
+    state = {"pending": 1, "received": 0, "failures": 0, "collecting": True, "last_failed": None, "force_fallback": force_fallback}
+    stage_pending = {stage: 0 for stage in PIPELINE_STAGE_WORKERS}
+    screening_buffer = []
+    
+    def run_stage(stage, item, task, args):
+        # 협력적 취소: 중단 요청 후에는 새 작업을 시작하지 않음
+        if stop_event.is_set() or time.time() > deadline:
+            events.put((stage, item, cancelled))
+            return
+        try:
+            output = task(*args)
+        except Exception as e:
+            print_progress(f"{stage} 단계 오류: {e}")
+            output = None
+        events.put((stage, item, output))
+    
+    def submit(stage, item, task, *args):
+        pool = "verification" if stage == "fallback" else stage
+        state["pending"] += 1
+        stage_pending[pool] += 1
+        executors[pool].submit(run_stage, stage, item, task, args)
+    
+    def produce():
+        # 기사 수집 스레드: 하나씩 꺼내 전달하고, 중단 요청 시 수집기를 닫아 남은 요청을 취소
+        iterator = iter(articles)
+        try:
+            for article in iterator:
+                if stop_event.is_set():
+                    break
+                events.put(("source", article, True))
+        except Exception as e:
+            print_progress(f"기사 수집 오류: {e}")
+        finally:
+            if hasattr(iterator, "close"):
+                iterator.close()
+            events.put(("source", None, None))
+    
+    def flush_screening(force=False):
+        # 내용 보강이 끝난 기사를 모아 일괄 스크리닝 (수집과 보강이 모두 끝나면 남은 기사도 전송)
+        while screening_buffer and (force or len(screening_buffer) >= SCREENING_BATCH_SIZE):
+            batch = screening_buffer[:SCREENING_BATCH_SIZE]
+            del screening_buffer[:SCREENING_BATCH_SIZE]
+            submit("screening", batch, batch_screen_articles, [batch_item["article"] for batch_item in batch])
+    
+    def try_fallback(item):
+        # 팩트체크 실패 시 백업 전략 시도 (수집이 끝나 전체 기사 수를 알 때만 실패 비율로 판단)
+        if state["force_fallback"] or (not state["collecting"] and state["failures"] >= state["received"] / 2):
+            print_progress("팩트체크 결과 없음, 대체 접근법 사용...")
+            submit("fallback", item, fallback_direct_factcheck, item["article"])
+            state["force_fallback"] = False  # 한 번만 강제 처리
+            return True
+        return False
+    
+    def handle_failure(item):
+        state["failures"] += 1
+        state["last_failed"] = None if try_fallback(item) else item
+    
+    producer = threading.Thread(target=produce, name="pipeline-source", daemon=True)
+    producer.start()
+    
+    try:
+        while state["pending"] > 0:
+            # 시간 제한 체크
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                print_progress(f"시간 제한 임박 ({time.time() - start_time:.1f}초), 처리 중단")
+                break
+            
+            try:
+                stage, item, output = events.get(timeout=min(remaining, 1.0))
+            except queue.Empty:
+                continue
+            
+            if stage == "source":
+                if output is None:
+                    # 수집 종료
+                    state["pending"] -= 1
+                    state["collecting"] = False
+                    flush_screening(force=stage_pending["content"] == 0)
+                    if state["last_failed"] and not accepted and try_fallback(state["last_failed"]):
+                        state["last_failed"] = None
+                else:
+                    state["received"] += 1
+                    print_progress(f"기사 처리 중: {item.get('title', '')[:50]}...")
+                    # 분류기가 점수를 매기는 것과 같은 텍스트(내용 보강 전)로 판정을 기록
+                    submit("content", {"article": item, "screening_text": screening_text(item)}, expand_article_content, item)
+                continue
+            
+            state["pending"] -= 1
+            stage_pending["verification" if stage == "fallback" else stage] -= 1
+            if output is cancelled:
+                continue
+            
+            if stage == "content":
+                screening_buffer.append(item)
+                flush_screening(force=not state["collecting"] and stage_pending["content"] == 0)
+            elif stage == "screening":
+                # item은 일괄 스크리닝한 기사 묶음, output은 기사별 판정 목록 (판정 없음은 None)
+                verdicts = output or [None] * len(item)
+                if output:
+                    append_screening_history([batch_item["screening_text"] for batch_item in item], output)
+                for batch_item, has_claim in zip(item, verdicts):
+                    if has_claim:
+                        submit("extraction", batch_item, extract_factcheckable_claim, batch_item["article"])
+                    else:
+                        handle_failure(batch_item)
+            elif stage == "extraction":
+                if output:
+                    item["claim_info"] = output
+                    submit("evidence", item, gather_verification_evidence, output)
+                else:
+                    handle_failure(item)
+            elif stage == "evidence":
+                submit("verification", item, verify_factcheck_claim, item["claim_info"], output or [])
+            elif output:
+                # 결과 처리 (중복 확인 및 품질 검증)
+                if accept_result(item["article"], output):
+                    accepted.append(output)
+                    
+                    # 목표 달성 시 진행 중인 작업 취소
+                    if len(accepted) >= max_results:
+                        break
+            elif stage == "verification":
+                handle_failure(item)
+    finally:
+        stop_event.set()
+        for executor in executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
     
-    return card_html
+    return accepted
+
+# 정당별 스타일 클래스 (표시 클래스, 아바타 클래스)
+PARTY_STYLES = {
+    "더불어민주당": ("democrat-indicator", "democrat-avatar"),
+    "국민의힘": ("ppp-indicator", "ppp-avatar"),
+    "개혁신당": ("reform-indicator", "reform-avatar"),
+    "조국혁신당": ("choi-indicator", "choi-avatar"),
+    "정의당": ("reform-indicator", "reform-avatar")
+}
+DEFAULT_PARTY_STYLE = ("ppp-indicator", "ppp-avatar")
+
+# 검증 결과별 스타일 클래스
+VERIFICATION_RESULT_CLASSES = {
+    "사실": "result-true",
+    "대체로 사실": "result-mostly-true",
+    "일부 사실": "result-partially-true",
+    "사실 아님": "result-false"
+}
+DEFAULT_RESULT_CLASS = "result-unverifiable"
+
+# 팩트체크 카드 템플릿 (*_html 필드는 이미 이스케이프된 조각, 나머지는 렌더링 시 이스케이프)
+CARD_TEMPLATE = """<!-- 팩트체크 카드 -->
+<div class="falsehood-card" data-party="{party}">
+<div class="falsehood-header">
+<div class="politician-avatar {avatar_class}">{first_letter}</div>
+<div class="politician-info">
+<div class="politician-name">
+<span class="party-indicator {party_class}"></span>
+{politician_display}
+</div>
+<div class="party-name-small">{party}</div>
+</div>
+<div class="falsehood-date">{date}</div>
+</div>
+<div class="falsehood-source">
+<i class="fas fa-bullhorn"></i> {context}
+</div>
+<div class="verification-result {result_class}">
+<span class="result-label">검증 결과:</span> {verification_result}
+</div>
+<div class="falsehood-content">
+{statement}
+</div>
+<div class="falsehood-correction">
+<span class="correction-label">검증 설명:</span>
+{explanation}
+</div>
+{sources_html}</div>
+"""
+SOURCES_TEMPLATE = """<div class="falsehood-sources">
+<span class="sources-label">참고 출처:</span>
+<ul>
+{items_html}</ul>
+</div>
+"""
+SOURCE_LINK_TEMPLATE = '<li><a href="{href}" target="_blank">{source}</a></li>\n'
+SOURCE_TEXT_TEMPLATE = '<li>{source}</li>\n'
+
+# format 형식 템플릿 컴파일
+def compile_template(template):
+    """템플릿을 (고정 문자열, 필드명) 조각 목록으로 한 번만 분해"""
+    return [(literal, field) for literal, field, _, _ in string.Formatter().parse(template)]
 
-# 기존 발언 카드에서 이미 처리된 발언을 추출하는 함수
-def extract_existing_statements(html_content):
-    """HTML에서 기존 팩트체크 발언 추출"""
+# 컴파일된 템플릿 렌더링
+def render_template(parts, **values):
+    """*_html 필드를 제외한 모든 값을 HTML 이스케이프하여 채움"""
+    rendered = []
+    for literal, field in parts:
+        rendered.append(literal)
+        if field is not None:
+            value = values[field]
+            rendered.append(value if field.endswith("_html") else html.escape(str(value or ""), quote=True))
+    return "".join(rendered)
+
+COMPILED_CARD_TEMPLATE = compile_template(CARD_TEMPLATE)
+COMPILED_SOURCES_TEMPLATE = compile_template(SOURCES_TEMPLATE)
+COMPILED_SOURCE_LINK_TEMPLATE = compile_template(SOURCE_LINK_TEMPLATE)
+COMPILED_SOURCE_TEXT_TEMPLATE = compile_template(SOURCE_TEXT_TEMPLATE)
+
+# 출처 목록 HTML 생성
+def render_sources_html(sources):
+    """출처 목록 HTML (링크는 http/https 주소만 허용)"""
+    if not sources:
+        return ""
     
-    existing_statements = []
+    items_html = ""
+    for source in sources:
+        source = str(source or "")
+        if source.startswith("http://") or source.startswith("https://"):
+            items_html += render_template(COMPILED_SOURCE_LINK_TEMPLATE, href=source, source=source)
+        elif source.startswith("www."):
+            items_html += render_template(COMPILED_SOURCE_LINK_TEMPLATE, href="https://" + source, source=source)
+        else:
+            items_html += render_template(COMPILED_SOURCE_TEXT_TEMPLATE, source=source)
+    return render_template(COMPILED_SOURCES_TEMPLATE, items_html=items_html)
+
+# 여러 팩트체크 카드 HTML을 한 번에 생성
+def render_fact_check_cards(fact_checks):
+    """팩트체크 결과 목록을 순서대로 HTML 카드로 변환"""
+    cards = []
+    for fact_check in fact_checks:
+        party = fact_check.get("party", "")
+        party_class, avatar_class = PARTY_STYLES.get(party, DEFAULT_PARTY_STYLE)
+        verification_result = fact_check.get("verification_result") or "확인 불가"
+        speaker = fact_check.get("speaker", "")
+        
+        cards.append(render_template(
+            COMPILED_CARD_TEMPLATE,
+            party=party,
+            party_class=party_class,
+            avatar_class=avatar_class,
+            first_letter=speaker[0] if speaker else "?",  # 정치인 이름의 첫 글자
+            politician_display=f'{speaker} {fact_check.get("speaker_position", "")}'.strip(),
+            date=fact_check.get("date", ""),
+            context=fact_check.get("context", ""),
+            result_class=VERIFICATION_RESULT_CLASSES.get(verification_result, DEFAULT_RESULT_CLASS),
+            verification_result=verification_result,
+            statement=fact_check.get("statement", ""),
+            explanation=fact_check.get("explanation", ""),
+            sources_html=render_sources_html(fact_check.get("sources"))
+        ))
+    return "".join(cards)
+
+# 카드 HTML에서 필드를 추출하는 정규식 (색인 최초 생성용)
+CARD_FIELD_PATTERNS = {
+    "party": r'<div class="falsehood-card" data-party="([^"]*)"',
+    "speaker": r'<div class="politician-name">\s*<span[^>]*>.*?</span>\s*(.*?)\s*</div>',
+    "date": r'<div class="falsehood-date">\s*(.*?)\s*</div>',
+    "context": r'<div class="falsehood-source">\s*(?:<i[^>]*></i>)?\s*(.*?)\s*</div>',
+    "verification_result": r'<div class="verification-result[^"]*">\s*<span class="result-label">[^<]*</span>\s*(.*?)\s*</div>',
+    "statement": r'<div class="falsehood-content">\s*(.*?)\s*</div>',
+    "explanation": r'<div class="falsehood-correction">\s*<span class="correction-label">[^<]*</span>\s*(.*?)\s*</div>'
+}
+
+# 발언 중복 확인용 해시
+def statement_hash(statement):
+    """정규화된 발언 내용의 해시"""
+    return hashlib.sha256(normalize_claim_text(statement).encode('utf-8')).hexdigest()[:16]
+
+# 팩트체크 결과를 색인 레코드로 변환
+def make_factcheck_record(fact_check):
+    """카드 하나를 다시 그리는 데 필요한 필드와 발언 해시를 담은 레코드"""
+    return {
+        "statement_hash": statement_hash(fact_check.get("statement", "")),
+        "speaker": fact_check.get("speaker", ""),
+        "speaker_position": fact_check.get("speaker_position", ""),
+        "party": fact_check.get("party", ""),
+        "date": fact_check.get("date", ""),
+        "verification_result": fact_check.get("verification_result", "확인 불가"),
+        "statement": fact_check.get("statement", ""),
+        "context": fact_check.get("context", ""),
+        "explanation": fact_check.get("explanation", ""),
+        "sources": fact_check.get("sources", [])
+    }
+
+# 기존 HTML의 팩트체크 카드를 카드 단위로 파싱
+def parse_published_cards(html_content):
+    """카드 마커 사이의 카드들을 색인 레코드로 변환 (오래된 카드부터)"""
+    # 페이지 스크립트의 카드 템플릿 문자열이 카드로 읽히지 않도록 마커 사이만 파싱
+    cards_html = marked_region(html_content, CARDS_START_MARKER, CARDS_END_MARKER)
+    if cards_html is None:
+        print_progress(f"마커 '{CARDS_START_MARKER}'/'{CARDS_END_MARKER}'를 HTML 파일에서 찾을 수 없음")
+        return []
     
-    # 정규식으로 기존 발언 추출
-    falsehood_contents = re.findall(r'<div class="falsehood-content">\s*(.*?)\s*</div>', html_content, re.DOTALL)
-    politician_names = re.findall(r'<div class="politician-name">\s*<span[^>]*>.*?</span>\s*(.*?)\s*</div>', html_content, re.DOTALL)
+    card_starts = [m.start() for m in re.finditer(r'<div class="falsehood-card"', cards_html)]
+    records = []
     
-    for i, content in enumerate(falsehood_contents):
-        # 태그 제거
-        clean_content = re.sub(r'<[^>]+>', '', content).strip()
-        existing_statements.append(clean_content)
+    for i, card_start in enumerate(card_starts):
+        card_end = card_starts[i + 1] if i + 1 < len(card_starts) else len(cards_html)
+        card_html = cards_html[card_start:card_end]
         
-        # 정치인 이름과 발언을 함께 저장 (가능한 경우)
-        if i < len(politician_names):
-            politician_name = re.sub(r'<[^>]+>', '', politician_names[i]).strip()
-            existing_statements.append(f"{politician_name}:{clean_content}")
+        # 카드마다 따로 추출하므로 잘못된 카드가 다른 카드의 짝을 밀어내지 않음
+        fields = {}
+        for field, pattern in CARD_FIELD_PATTERNS.items():
+            match = re.search(pattern, card_html, re.DOTALL)
+            fields[field] = html.unescape(re.sub(r'<[^>]+>', '', match.group(1)).strip()) if match else ""
+        
+        sources_block = re.search(r'<div class="falsehood-sources">(.*?)</ul>', card_html, re.DOTALL)
+        fields["sources"] = [
+            html.unescape(re.sub(r'<[^>]+>', '', source).strip())
+            for source in re.findall(r'<li>(.*?)</li>', sources_block.group(1), re.DOTALL)
+        ] if sources_block else []
+        
+        if fields["statement"]:
+            records.append(make_factcheck_record(fields))
+    
+    # 페이지는 최신 카드가 위에 있으므로 게시 순서로 뒤집음
+    return list(reversed(records))
+
+# 게시된 모든 페이지의 카드를 파싱
+def parse_published_pages():
+    """월별 아카이브 페이지(오래된 달부터)와 index.html의 카드를 색인 레코드로 변환
+
+    index.html에는 최신 카드만 있으므로 아카이브 목록이 있으면 그 페이지들도 모두 읽는다.
+    목록의 페이지가 없거나 카드 수가 맞지 않으면 오래된 카드가 사라진 색인으로 게시하지 않도록 오류를 낸다.
+    """
+    archive_entries = []
+    if os.path.exists(ARCHIVE_MANIFEST_FILE):
+        with open(ARCHIVE_MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            archive_entries = json.load(f).get("archives", [])
+    
+    records = []
+    for entry in sorted(archive_entries, key=lambda entry: entry["month"]):
+        if not os.path.exists(entry["path"]):
+            raise RuntimeError(f"아카이브 페이지 없음, 색인을 복원할 수 없음: {entry['path']}")
+        with open(entry["path"], 'r', encoding='utf-8') as file:
+            month_records = parse_published_cards(file.read())
+        if len(month_records) != entry["count"]:
+            raise RuntimeError(f"아카이브 페이지 카드 수 불일치 ({len(month_records)}/{entry['count']}): {entry['path']}")
+        records.extend(month_records)
+    
+    with open('index.html', 'r', encoding='utf-8') as file:
+        records.extend(parse_published_cards(file.read()))
+    return records
+
+# 게시된 팩트체크 색인 로드
+def load_factcheck_index():
+    """색인 레코드 로드 (색인이 없으면 게시된 페이지에서 한 번만 생성)"""
+    if not os.path.exists(FACTCHECK_INDEX_FILE):
+        records = parse_published_pages()
+        append_factcheck_index(records)
+        print_progress(f"게시된 페이지에서 팩트체크 색인 생성: {len(records)}개 카드")
+        return records
+    
+    records = []
+    with open(FACTCHECK_INDEX_FILE, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                records.append(json.loads(line))
+    return records
+
+# 게시된 팩트체크 색인에 레코드 추가
+def append_factcheck_index(records):
+    """새로 게시한 카드 레코드를 색인 파일 끝에 추가"""
+    with open(FACTCHECK_INDEX_FILE, 'a', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+# 마커 사이 영역 추출
+def marked_region(content, start_marker, end_marker):
+    """start_marker와 end_marker 사이의 내용 (마커가 없으면 None)"""
+    start = content.find(start_marker)
+    end = content.find(end_marker, start)
+    if start < 0 or end < 0:
+        return None
+    return content[start + len(start_marker):end]
+
+# 마커 사이 영역 교체
+def replace_marked_region(content, start_marker, end_marker, inner_html):
+    """start_marker와 end_marker 사이를 inner_html로 교체 (마커가 없으면 None)"""
+    start = content.find(start_marker)
+    end = content.find(end_marker, start)
+    if start < 0 or end < 0:
+        return None
+    start += len(start_marker)
+    
+    # 끝 마커 줄의 들여쓰기는 유지
+    line_start = content.rfind("\n", start, end) + 1
+    if line_start > start and not content[line_start:end].strip():
+        end = line_start
+    return content[:start] + "\n" + inner_html + content[end:]
+
+# 내용이 바뀐 경우에만 파일 쓰기
+def write_file_if_changed(path, content):
+    """파일 내용이 다를 때만 쓰고 실제로 썼는지 반환"""
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as file:
+            if file.read() == content:
+                return False
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(content)
+    return True
+
+# 카드가 속한 아카이브 월
+def archive_month(record):
+    """카드 날짜(YYYY.MM.DD)에서 아카이브 월(YYYY-MM) 추출"""
+    match = re.match(r'(\d{4})\.(\d{1,2})', record.get("date", ""))
+    return f"{match.group(1)}-{int(match.group(2)):02d}" if match else "unknown"
+
+# 여러 카드 HTML 생성 (최신 카드가 위로)
+def render_cards(records):
+    return render_fact_check_cards(list(reversed(records)))
+
+# 아카이브 링크 목록 HTML 생성
+def render_archive_links(archive_entries):
+    links = ""
+    for entry in archive_entries:
+        year, _, month = entry["month"].partition("-")
+        label = f"{year}년 {month}월" if month else entry["month"]
+        links += f'<a class="archive-link" href="{entry["path"]}">{label} ({entry["count"]})</a>\n'
+    return links
+
+# 월별 아카이브 페이지 생성
+def build_archive_page(index_content, month, records):
+    """index.html을 틀로 사용해 한 달 치 카드만 담은 아카이브 페이지 생성"""
+    page = replace_marked_region(index_content, CARDS_START_MARKER, CARDS_END_MARKER, render_cards(records))
+    page = replace_marked_region(
+        page, ARCHIVE_LINKS_START_MARKER, ARCHIVE_LINKS_END_MARKER,
+        '<a class="archive-link" href="../index.html">최신 팩트체크 보기</a>\n'
+    )
+    # 아카이브 페이지는 한 달 치 카드만 보여주므로 데이터 피드 지연 로딩 비활성화
+    page = page.replace(f' data-feed="{FEED_MANIFEST_FILE}"', '', 1)
+    return re.sub(r'<title>(.*?)</title>', f'<title>\\1 - {month} 아카이브</title>', page, count=1)
+
+# JSON 데이터 피드 작성
+def write_factcheck_feed(records, new_count, index_cards):
+    """전체 카드를 게시 순서대로 FEED_CHUNK_SIZE개씩 나눠 JSON 청크로 저장
+
+    청크는 오래된 카드부터 채워지므로 새 카드가 추가될 때는 마지막 청크만 바뀐다.
+    """
+    os.makedirs(FEED_DIR, exist_ok=True)
+    chunk_count = (len(records) + FEED_CHUNK_SIZE - 1) // FEED_CHUNK_SIZE
+    chunk_paths = [f"{FEED_DIR}/factchecks-{i:04d}.json" for i in range(chunk_count)]
+    
+    first_changed_chunk = max(0, len(records) - new_count) // FEED_CHUNK_SIZE
+    for i, chunk_path in enumerate(chunk_paths):
+        if i < first_changed_chunk and os.path.exists(chunk_path):
+            continue
+        with open(chunk_path, 'w', encoding='utf-8') as f:
+            json.dump(records[i * FEED_CHUNK_SIZE:(i + 1) * FEED_CHUNK_SIZE], f, ensure_ascii=False, separators=(',', ':'))
+    
+    with open(FEED_MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump({
+            "updated": datetime.datetime.now().strftime("%Y.%m.%d"),
+            "total": len(records),
+            "index_cards": index_cards,
+            "chunk_size": FEED_CHUNK_SIZE,
+            "chunks": chunk_paths
+        }, f, ensure_ascii=False, indent=2)
+    print_progress(f"데이터 피드 저장: {len(records)}개 카드, {chunk_count}개 청크")
+
+# index.html과 월별 아카이브 페이지 작성
+def publish_factcheck_pages(index_content, records, new_count):
+    """최신 INDEX_PAGE_CARDS개 카드는 index.html에, 나머지는 월별 아카이브에 기록
+
+    아카이브는 매번 전체를 다시 렌더링하지만 내용이 바뀐 파일만 다시 쓴다.
+    """
+    index_records = records[-INDEX_PAGE_CARDS:] if INDEX_PAGE_CARDS > 0 else []
+    archived_records = records[:len(records) - len(index_records)]
+    
+    archives = {}
+    for record in archived_records:
+        archives.setdefault(archive_month(record), []).append(record)
+    archive_entries = [
+        {"month": month, "path": f"{ARCHIVE_DIR}/{month}.html", "count": len(archives[month])}
+        for month in sorted(archives, reverse=True)
+    ]
+    
+    # 최신 카드와 아카이브 링크로 index.html 갱신
+    new_content = replace_marked_region(index_content, CARDS_START_MARKER, CARDS_END_MARKER, render_cards(index_records))
+    if new_content is None:
+        print_progress(f"마커 '{CARDS_START_MARKER}'/'{CARDS_END_MARKER}'를 HTML 파일에서 찾을 수 없음")
+        return False
+    new_content = replace_marked_region(
+        new_content, ARCHIVE_LINKS_START_MARKER, ARCHIVE_LINKS_END_MARKER, render_archive_links(archive_entries)
+    ) or new_content
     
-    return existing_statements
+    with open('index.html', 'w', encoding='utf-8') as file:
+        file.write(new_content)
+    print_progress(f"HTML 파일 저장 성공 (최신 카드 {len(index_records)}개)")
+    
+    # 나머지 카드는 브라우저가 스크롤에 맞춰 데이터 피드에서 불러옴
+    write_factcheck_feed(records, new_count, len(index_records))
+    
+    # 저장된 레코드로 모든 아카이브 페이지를 다시 렌더링하고, 내용이 바뀐 달만 파일에 씀
+    os.makedirs(ARCHIVE_DIR, exist_ok=True)
+    for month, month_records in archives.items():
+        if write_file_if_changed(os.path.join(ARCHIVE_DIR, f"{month}.html"), build_archive_page(new_content, month, month_records)):
+            print_progress(f"아카이브 페이지 저장: {month} ({len(month_records)}개 카드)")
+    
+    manifest = {"index_cards": len(index_records), "archives": archive_entries}
+    if write_file_if_changed(ARCHIVE_MANIFEST_FILE, json.dumps(manifest, ensure_ascii=False, indent=2)):
+        print_progress(f"아카이브 목록 저장: {len(archive_entries)}개 페이지")
+    
+    return True
 
 # 임시 파일 정리
 def cleanup_temp_files():
@@ -1210,25 +3105,15 @@ def cleanup_temp_files():
                     os.remove(file_path)
                     print_progress(f"오래된 임시 파일 삭제: {file_path}")
         
-        # 검색 캐시는 유지하고 크기만 관리
-        if os.path.exists(SEARCH_CACHE_FILE):
-            try:
-                with open(SEARCH_CACHE_FILE, 'r', encoding='utf-8') as f:
-                    cache = json.load(f)
-                    
-                if len(cache) > 200:  # 캐시가 너무 크면
-                    # 50% 무작위 삭제
-                    keys_to_delete = random.sample(list(cache.keys()), len(cache) // 2)
-                    for key in keys_to_delete:
-                        del cache[key]
-                        
-                    # 줄어든 캐시 저장
-                    with open(SEARCH_CACHE_FILE, 'w', encoding='utf-8') as f:
-                        json.dump(cache, f, ensure_ascii=False)
-                        
-                    print_progress(f"검색 캐시 크기 조정: {len(cache)}개 항목")
-            except Exception as e:
-                print_progress(f"캐시 정리 오류: {e}")
+        # 검색/LLM/페이지 캐시는 유지하고 만료 항목과 LRU 초과분만 정리
+        for label, cache in [("검색", search_cache), ("LLM 응답", llm_cache), ("기사 페이지", page_cache)]:
+            if cache is not None:
+                removed = cache.evict()
+                if removed:
+                    print_progress(f"{label} 캐시 크기 조정: {removed}개 항목 삭제, {len(cache)}개 유지")
+        
+        if search_fingerprints is not None:
+            search_fingerprints.prune(search_cache.table)
     except Exception as e:
         print_progress(f"임시 파일 정리 오류: {e}")
 
@@ -1243,20 +3128,14 @@ def update_html_file():
         # 초기 설정
         initialize()
         
-        # 정치인 발언 수집
-        statements = collect_politician_statements()
-        
-        if not statements:
-            print_progress("발언 수집 실패, 업데이트하지 않습니다.")
-            return
-        
         # 현재 HTML 파일 읽기
         with open('index.html', 'r', encoding='utf-8') as file:
             content = file.read()
         
-        # 기존 발언 추출
-        existing_statements = extract_existing_statements(content)
-        print_progress(f"기존 발언 {len(existing_statements)}개 발견")
+        # 기존 발언 색인 로드 (중복 확인은 발언 해시 집합으로 수행)
+        published_records = load_factcheck_index()
+        published_hashes = {record["statement_hash"] for record in published_records}
+        print_progress(f"기존 발언 {len(published_hashes)}개 발견")
         
         # CSS 스타일 추가 (검증 결과 표시용) - 필요한 경우에만
         if '.verification-result' not in content:
@@ -1319,130 +3198,60 @@ def update_html_file():
             if style_end_pos > 0:
                 content = content[:style_end_pos] + style_addition + content[style_end_pos:]
                 print_progress("검증 결과 스타일 CSS에 추가됨")
-                
-                # 업데이트된 HTML 내용으로 파일 쓰기
-                with open('index.html', 'w', encoding='utf-8') as file:
-                    file.write(content)
-                
-                # 다시 읽기
-                with open('index.html', 'r', encoding='utf-8') as file:
-                    content = file.read()
             else:
                 print_progress("</style> 태그를 찾을 수 없음")
         
-        # 팩트체크 결과 저장
-        factcheck_results = []
-        
-        # 효율적 팩트체크를 위해 기사 수 제한
-        max_articles_to_process = 15
-        
-        # 처리할 기사 선택적 확장 및 임의 선택
-        articles_to_process = []
-        selected_articles = random.sample(statements, min(max_articles_to_process, len(statements)))
-        
-        for article in selected_articles:
-            try:
-                # 내용이 짧으면 전체 기사 내용 가져오기
-                if len(article.get('content', '')) < 300:
-                    url = article.get('url', '')
-                    full_content = get_full_article_content(url)
-                    if full_content and len(full_content) > len(article.get('content', '')):
-                        article['content'] = full_content
-                articles_to_process.append(article)
-            except Exception as e:
-                print_progress(f"기사 내용 확장 오류: {e}")
-                articles_to_process.append(article)  # 원래 내용 그대로 추가
+        # 정치인 발언 수집 → 로컬 사전 스크리닝을 거친 기사를 수집되는 즉시 팩트체크
+        # (목표 달성 시 수집도 중단되어 나머지 기사는 가져오지 않음)
+        articles_to_process = gate_articles_for_screening(iter_politician_statements())
         
-        # 각 기사에 대해 3단계 팩트체크 수행
-        attempts = 0
-        force_process = FORCE_UPDATE  # 강제 처리 옵션
-        
-        for article in articles_to_process:
-            # 시간 제한 체크
-            elapsed_time = time.time() - start_time
-            if elapsed_time > (MAX_RUNTIME_SECONDS * 0.8):
-                print_progress(f"시간 제한 임박 ({elapsed_time:.1f}초), 처리 중단")
-                break
-            
-            # 중복 방지
-            url = article.get('url', '')
-            if url in processed_urls:
-                continue
-            
-            print_progress(f"기사 처리 중: {article.get('title', '')[:50]}...")
-            attempts += 1
+        def accept_result(article, factcheck_result):
+            # 중복 확인 - 정규화된 발언 해시가 이미 게시되었는지 확인
+            new_statement_hash = statement_hash(factcheck_result.get("statement", ""))
             
-            # 3단계 팩트체크 수행
-            factcheck_result = three_stage_factcheck(article)
+            if new_statement_hash in published_hashes:
+                print_progress("중복 발언 건너뜀")
+                return False
             
-            # 팩트체크 실패 시 백업 전략 시도
-            if not factcheck_result and (force_process or attempts >= len(articles_to_process) / 2):
-                print_progress("팩트체크 결과 없음, 대체 접근법 사용...")
-                factcheck_result = fallback_direct_factcheck(article)
-                force_process = False  # 한 번만 강제 처리
+            # 품질 검증
+            if not validate_factcheck_quality(factcheck_result):
+                print_progress("팩트체크 결과 품질 검증 실패")
+                return False
             
-            # 결과 처리
-            if factcheck_result:
-                # 중복 확인
-                new_statement = factcheck_result.get("statement", "")
-                speaker = factcheck_result.get("speaker", "")
-                
-                # 발언 내용이나 "발언자:발언" 조합이 이미 존재하는지 확인
-                is_duplicate = (new_statement in existing_statements or 
-                              f"{speaker}:{new_statement}" in existing_statements)
-                
-                if is_duplicate:
-                    print_progress("중복 발언 건너뜀")
-                    continue
-                
-                # 품질 검증
-                if validate_factcheck_quality(factcheck_result):
-                    print_progress(f"검증 성공: {factcheck_result.get('verification_result')}")
-                    factcheck_results.append(factcheck_result)
-                    processed_urls.add(url)
-                    
-                    # 목표 달성 시 중단 (하루에 1개만)
-                    if len(factcheck_results) >= 1:
-                        break
-                else:
-                    print_progress("팩트체크 결과 품질 검증 실패")
+            print_progress(f"검증 성공: {factcheck_result.get('verification_result')}")
+            published_hashes.add(new_statement_hash)
+            processed_urls.add(article.get('url', ''))
+            return True
+        
+        # 파이프라인으로 팩트체크 수행 (목표 달성 시 중단 - 하루에 1개만)
+        factcheck_results = run_factcheck_pipeline(
+            articles_to_process,
+            accept_result,
+            max_results=1,
+            deadline=start_time + MAX_RUNTIME_SECONDS * 0.8,
+            force_fallback=FORCE_UPDATE  # 강제 처리 옵션
+        )
         
         # 결과가 없으면 종료
         if not factcheck_results:
             print_progress("팩트체크 결과 생성 실패, 업데이트하지 않습니다.")
             return
         
-        # 팩트체크 카드 HTML 생성
-        all_cards_html = ""
-        for result in factcheck_results:
-            card_html = generate_fact_check_card_html(result)
-            all_cards_html += card_html
+        # 새 카드를 기존 색인 뒤에 이어 붙임
+        new_records = [make_factcheck_record(result) for result in factcheck_results]
         
-        # 마커 확인
-        insert_marker = "<!-- FACT_CHECK_CARDS -->"
+        today = datetime.datetime.now().strftime("%Y.%m.%d")
+        print_progress(f"{today}에 {len(new_records)}개 새 팩트체크 카드 추가")
         
-        if insert_marker in content:
-            # 마커 위치 찾기
-            marker_position = content.find(insert_marker) + len(insert_marker)
-            
-            # 새 콘텐츠 생성
-            new_content = content[:marker_position] + "\n" + all_cards_html + content[marker_position:]
-            
-            # 마지막 업데이트 날짜 갱신
-            today = datetime.datetime.now().strftime("%Y.%m.%d")
-            print_progress(f"{today}에 {len(factcheck_results)}개 새 팩트체크 카드 추가")
-            
-            # HTML 파일에서 제목 및 레이블 텍스트 업데이트
-            new_content = new_content.replace("허위 발언 트래커", "정치인 발언 검증 서비스")
-            new_content = new_content.replace("<!-- 허위 발언 카드", "<!-- 팩트체크 카드")
-            new_content = new_content.replace('<span class="correction-label">실제 사실:</span>', '<span class="correction-label">검증 설명:</span>')
-            
-            # 업데이트된 콘텐츠 저장
-            with open('index.html', 'w', encoding='utf-8') as file:
-                file.write(new_content)
-                print_progress("HTML 파일 저장 성공")
-        else:
-            print_progress(f"마커 '{insert_marker}'를 HTML 파일에서 찾을 수 없음")
+        # HTML 파일에서 제목 및 레이블 텍스트 업데이트
+        content = content.replace("허위 발언 트래커", "정치인 발언 검증 서비스")
+        content = content.replace("<!-- 허위 발언 카드", "<!-- 팩트체크 카드")
+        content = content.replace('<span class="correction-label">실제 사실:</span>', '<span class="correction-label">검증 설명:</span>')
+        
+        # 최신 카드는 index.html에, 오래된 카드는 월별 아카이브에 저장 (파일당 한 번만 쓰기)
+        if publish_factcheck_pages(content, published_records + new_records, len(new_records)):
+            # 게시한 카드를 색인에 추가
+            append_factcheck_index(new_records)
         
         # 캐시 저장
         save_cache()
@@ -1451,6 +3260,13 @@ def update_html_file():
         print_progress(f"HTML 파일 업데이트 오류: {e}")
         traceback.print_exc()
     finally:
+        # 캐시 통계 출력
+        if llm_cache is not None:
+            print_progress(llm_cache.stats_message("LLM 응답"))
+        if page_cache is not None:
+            print_progress(page_cache.stats_message("기사 페이지"))
+        print_llm_usage()
+        
         # 실행 시간 출력
         elapsed_time = time.time() - start_time
         print_progress(f"총 실행 시간: {elapsed_time:.2f}초")